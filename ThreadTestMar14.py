@@ -12,6 +12,9 @@ QtBackgroundTaskService implementation. It includes tests for:
 - Resource cleanup
 - Stress testing
 """
+import collections
+import html
+from contextlib import contextmanager
 import sys
 import os
 import time
@@ -23,10 +26,10 @@ from typing import Dict, Any, List, Optional
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QTextEdit, QProgressBar, QGroupBox,
-    QListWidget, QListWidgetItem, QSplitter, QTabWidget,
+    QListWidget, QListWidgetItem, QListView, QSplitter, QTabWidget,
     QCheckBox, QSpinBox, QComboBox, QGridLayout, QMessageBox
 )
-from PySide6.QtCore import Qt, QTimer, Slot, QSize
+from PySide6.QtCore import Qt, QTimer, Slot, QSize, QMetaObject, Q_ARG
 
 # Ensure proper path
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
@@ -52,7 +55,6 @@ class UILogHandler(logging.Handler):
     def emit(self, record):
         msg = self.format(record)
         # Thread-safe update using Qt's signal/slot
-        from PySide6.QtCore import QMetaObject, Qt, Q_ARG
         QMetaObject.invokeMethod(
             self.text_edit,
             "append_log",
@@ -377,34 +379,63 @@ class MemoryLeakTestWorker(Worker[Dict[str, Any]]):
 class LogTextEdit(QTextEdit):
     """TextEdit widget that can display colored log messages."""
 
+    # Color per level threshold, checked from most to least severe
+    LEVEL_COLORS = (
+        (logging.ERROR, "red"),
+        (logging.WARNING, "#808000"),  # Qt.darkYellow
+        (logging.INFO, "black"),
+    )
+    DEBUG_COLOR = "#808080"  # Qt.darkGray
+
+    # Messages arriving within this window are appended in one layout pass
+    FLUSH_INTERVAL_MS = 50
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setReadOnly(True)
+        self._pending = collections.deque()
+        self._flush_scheduled = False
 
     @Slot(str, int)
     def append_log(self, text, level):
         # Set color based on log level
-        if level >= logging.ERROR:
-            self.setTextColor(Qt.red)
-        elif level >= logging.WARNING:
-            self.setTextColor(Qt.darkYellow)
-        elif level >= logging.INFO:
-            self.setTextColor(Qt.black)
-        else:  # DEBUG
-            self.setTextColor(Qt.darkGray)
+        color = self.DEBUG_COLOR
+        for threshold, level_color in self.LEVEL_COLORS:
+            if level >= threshold:
+                color = level_color
+                break
+
+        escaped = html.escape(text).replace("\n", "<br>")
+        self._pending.append(f"<span style='color:{color}'>{escaped}</span>")
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(self.FLUSH_INTERVAL_MS, self._flush)
+
+    def _flush(self):
+        """Append all pending log lines at once and scroll to the bottom."""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
 
-        # Append text
-        self.append(text)
+        # Only follow the output if the user has not scrolled up to read history
+        scroll_bar = self.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 4
 
-        # Reset color
-        self.setTextColor(Qt.black)
+        lines = "<br>".join(self._pending)
+        self._pending.clear()
+        self.append(lines)
 
-        # Scroll to bottom
-        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
 
 
 class TaskListItem(QListWidgetItem):
-    """List item representing a task in the UI."""
+    """List item representing a task in the UI.
+
+    Task state lives in a plain dict on the item and is updated in place, so a
+    status change costs a setText rather than a QVariant round-trip through
+    setData/data.
+    """
 
     def __init__(self, task_id, task_type, description=""):
         super().__init__()
@@ -412,43 +443,45 @@ class TaskListItem(QListWidgetItem):
         self.task_type = task_type
         self.description = description
 
-        # Set initial data
-        self.setData(Qt.UserRole, {
+        # Set initial state
+        self.state = {
             "id": task_id,
             "type": task_type,
             "status": "Pending",
             "progress": 0,
             "start_time": time.time()
-        })
+        }
+        self._foreground = None
 
         # Update display
         self.update_display()
 
     def update_status(self, status, progress=None):
-        data = self.data(Qt.UserRole)
-        data["status"] = status
+        self.state["status"] = status
         if progress is not None:
-            data["progress"] = progress
-        self.setData(Qt.UserRole, data)
+            self.state["progress"] = progress
         self.update_display()
 
     def update_display(self):
-        data = self.data(Qt.UserRole)
+        data = self.state
         elapsed = time.time() - data["start_time"]
 
         # Format task display text
         display_text = f"{data['id']} ({data['type']}): {data['status']} - {data['progress']}% [{elapsed:.1f}s]"
         self.setText(display_text)
 
-        # Set color based on status
+        # Set color based on status, touching the brush only when it changes
         if data["status"].startswith("Failed"):
-            self.setForeground(Qt.red)
+            color = Qt.red
         elif data["status"] == "Completed":
-            self.setForeground(Qt.darkGreen)
+            color = Qt.darkGreen
         elif data["status"] == "Cancelling":
-            self.setForeground(Qt.darkYellow)
+            color = Qt.darkYellow
         else:
-            self.setForeground(Qt.black)
+            color = Qt.black
+        if color != self._foreground:
+            self.setForeground(color)
+            self._foreground = color
 
 
 # =============== MAIN WINDOW ===============
@@ -579,6 +612,10 @@ class ThreadServiceTester(QMainWindow):
 
         self.task_list = QListWidget()
         self.task_list.setSelectionMode(QListWidget.SingleSelection)
+        # Every row is a single line of text, so size one and lay out the rest in batches
+        self.task_list.setUniformItemSizes(True)
+        self.task_list.setLayoutMode(QListView.Batched)
+        self.task_list.setBatchSize(64)
         self.task_list.currentItemChanged.connect(self._on_selected_task_changed)
         tasks_layout.addWidget(self.task_list)
 
@@ -703,6 +740,7 @@ class ThreadServiceTester(QMainWindow):
         """Start multiple tasks with varying configurations."""
         self.logger.info("Starting 5 tasks with varied configurations")
 
+        new_items = []
         for i in range(5):
             # Vary configurations
             worker_type = random.choice([
@@ -763,7 +801,7 @@ class ThreadServiceTester(QMainWindow):
             if result.is_success:
                 # Add to task list
                 item = TaskListItem(task_id, worker_type, f"Duration: {duration}")
-                self.task_list.addItem(item)
+                new_items.append(item)
                 self.tasks[task_id] = {
                     "item": item,
                     "type": worker_type
@@ -771,10 +809,13 @@ class ThreadServiceTester(QMainWindow):
             else:
                 self.logger.error(f"Failed to start task: {result.error}")
 
+        self._add_task_items(new_items)
+
     def _start_stress_test(self):
         """Start many tasks simultaneously to stress test the thread service."""
         self.logger.info("Starting stress test with 20 tasks")
 
+        new_items = []
         for i in range(20):
             # Generate varied configurations
             worker_type = random.choice([
@@ -824,7 +865,7 @@ class ThreadServiceTester(QMainWindow):
             if result.is_success:
                 # Add to task list
                 item = TaskListItem(task_id, worker_type)
-                self.task_list.addItem(item)
+                new_items.append(item)
                 self.tasks[task_id] = {
                     "item": item,
                     "type": worker_type
@@ -832,6 +873,25 @@ class ThreadServiceTester(QMainWindow):
             else:
                 self.logger.error(f"Failed to start task: {result.error}")
 
+        self._add_task_items(new_items)
+
+    @contextmanager
+    def _batch_task_list_updates(self):
+        """Suspend task list repaints and signals so a batch of changes is shown once."""
+        self.task_list.setUpdatesEnabled(False)
+        self.task_list.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.task_list.blockSignals(False)
+            self.task_list.setUpdatesEnabled(True)
+
+    def _add_task_items(self, items):
+        """Add task items to the list with a single repaint."""
+        with self._batch_task_list_updates():
+            for item in items:
+                self.task_list.addItem(item)
+
     def _cancel_selected_task(self):
         """Cancel the currently selected task."""
         # Get selected item
@@ -873,17 +933,21 @@ class ThreadServiceTester(QMainWindow):
 
     def _cleanup_completed_tasks(self):
         """Remove completed tasks from the list."""
-        for i in range(self.task_list.count() - 1, -1, -1):
-            item = self.task_list.item(i)
-            if isinstance(item, TaskListItem):
-                data = item.data(Qt.UserRole)
-                if data["status"] in ["Completed", "Failed"]:
-                    # Remove from list
-                    self.task_list.takeItem(i)
-
-                    # Remove from tasks dictionary
-                    if item.task_id in self.tasks:
-                        del self.tasks[item.task_id]
+        with self._batch_task_list_updates():
+            for i in range(self.task_list.count() - 1, -1, -1):
+                item = self.task_list.item(i)
+                if isinstance(item, TaskListItem):
+                    data = item.state
+                    if data["status"] in ["Completed", "Failed"]:
+                        # Remove from list
+                        self.task_list.takeItem(i)
+
+                        # Remove from tasks dictionary
+                        if item.task_id in self.tasks:
+                            del self.tasks[item.task_id]
+
+        # Selection signals were blocked during removal; sync the details panel once
+        self._on_selected_task_changed(self.task_list.currentItem(), None)
 
         self.logger.info("Cleaned up completed tasks")
 
@@ -892,16 +956,17 @@ class ThreadServiceTester(QMainWindow):
         running_tasks = self.thread_service.get_running_tasks()
 
         # Update task statuses
-        for task_id, task_info in list(self.tasks.items()):
-            item = task_info["item"]
-            data = item.data(Qt.UserRole)
+        with self._batch_task_list_updates():
+            for task_id, task_info in list(self.tasks.items()):
+                item = task_info["item"]
+                data = item.state
 
-            # If task was running but is no longer in running_tasks
-            if (data["status"] == "Running" or data["status"] == "Cancelling") and task_id not in running_tasks:
-                item.update_status("Unknown (Stopped)")
+                # If task was running but is no longer in running_tasks
+                if (data["status"] == "Running" or data["status"] == "Cancelling") and task_id not in running_tasks:
+                    item.update_status("Unknown (Stopped)")
 
-            # Update item display (to update elapsed time)
-            item.update_display()
+                # Update item display (to update elapsed time)
+                item.update_display()
 
         # Update statistics
         running_count = 0
@@ -911,7 +976,7 @@ class ThreadServiceTester(QMainWindow):
         for i in range(self.task_list.count()):
             item = self.task_list.item(i)
             if isinstance(item, TaskListItem):
-                data = item.data(Qt.UserRole)
+                data = item.state
                 if data["status"] == "Running":
                     running_count += 1
                 elif data["status"] == "Completed":
@@ -926,7 +991,7 @@ class ThreadServiceTester(QMainWindow):
     def _on_selected_task_changed(self, current, previous):
         """Handle change in selected task."""
         if current and isinstance(current, TaskListItem):
-            data = current.data(Qt.UserRole)
+            data = current.state
             self.progress_bar.setValue(data["progress"])
             self.status_label.setText(f"Task: {current.task_id} - Status: {data['status']}")
         else:
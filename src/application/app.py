@@ -41,30 +41,31 @@ def initialize_app() -> DIContainer:
     container.register_instance(IBackgroundTaskService, thread_service)
     # --- End Thread Service Setup ---
 
+    # Singletons registered above are captured directly rather than re-resolved
     container.register_factory(IWindowManager,
-                               lambda: WindowsWindowManager(container.resolve(ILoggerService)))
+                               lambda: WindowsWindowManager(logger))
     container.register_factory(
         IScreenshotService,
-        lambda: QtScreenshotService(container.resolve(ILoggerService))
+        lambda: QtScreenshotService(logger)
     )
     container.register_factory(
         IOcrService,
-        lambda: TesseractOcrService(container.resolve(ILoggerService))
+        lambda: TesseractOcrService(logger)
     )
     container.register_factory(
         IPlatformDetectionService,
         lambda: WindowsPlatformDetectionService(
-            logger=container.resolve(ILoggerService),
+            logger=logger,
             window_manager=container.resolve(IWindowManager)
         )
     )
     container.register_factory(
         ILockoutService,
         lambda: WindowsLockoutService(
-            logger=container.resolve(ILoggerService),
-            config_repository=container.resolve(IConfigRepository),
+            logger=logger,
+            config_repository=config_repo,
             platform_detection_service=container.resolve(IPlatformDetectionService),
-            thread_service=container.resolve(IBackgroundTaskService)
+            thread_service=thread_service
         )
     )
     container.register_factory(
@@ -72,20 +73,21 @@ def initialize_app() -> DIContainer:
         lambda: MonitoringService(
             screenshot_service=container.resolve(IScreenshotService),
             ocr_service=container.resolve(IOcrService),
-            thread_service=container.resolve(IBackgroundTaskService),
+            thread_service=thread_service,
             platform_detection_service=container.resolve(IPlatformDetectionService),
-            config_repository=container.resolve(IConfigRepository),
-            logger=container.resolve(ILoggerService)
+            config_repository=config_repo,
+            logger=logger
         )
     )
     container.register_factory(
         IVerificationService,
         lambda: WindowsVerificationService(
-            logger=container.resolve(ILoggerService),
-            config_repository=container.resolve(IConfigRepository),
-            thread_service = container.resolve(IBackgroundTaskService)
+            logger=logger,
+            config_repository=config_repo,
+            thread_service=thread_service
         )
     )
+    container.build()
     logger.info("Application dependencies initialized")
 
     return container
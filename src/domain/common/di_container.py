@@ -6,7 +6,7 @@ Simple dependency injection container for the application.
 This container manages service registrations and resolutions,
 allowing for clean dependency management throughout the application.
 """
-from typing import Dict, Any, Type, TypeVar, Callable, Optional, List
+from typing import Dict, Any, Type, TypeVar, Callable, Optional, List, Tuple
 import inspect
 
 
@@ -26,6 +26,7 @@ class DIContainer:
         self._instance_registrations = {}
         self._factory_registrations = {}
         self._resolving = set()  # Tracks types being resolved to detect circular dependencies
+        self._factories: Dict[Type, Callable[[], Any]] = {}  # Resolution table built by build()
 
     def register_instance(self, base_type: Type[TBase], instance: TBase) -> None:
         """
@@ -36,6 +37,7 @@ class DIContainer:
             instance: The instance to return
         """
         self._instance_registrations[base_type] = instance
+        self._factories.clear()
 
     def register_factory(self, base_type: Type[TBase], factory: Callable[[], TBase]) -> None:
         """
@@ -46,6 +48,52 @@ class DIContainer:
             factory: A function that creates and returns an instance
         """
         self._factory_registrations[base_type] = factory
+        self._factories.clear()
+
+    def build(self) -> None:
+        """
+        Precompute the resolution table from the current registrations.
+
+        Each registered type is mapped to a single callable: instance
+        registrations return the stored instance directly, factory
+        registrations call the factory with circular dependency detection.
+        Registering a new type after build() invalidates the table, and it
+        is rebuilt on the next resolve.
+        """
+        factories = {
+            base_type: self._guarded_factory(base_type, factory)
+            for base_type, factory in self._factory_registrations.items()
+        }
+
+        # Instance registrations take precedence over factories
+        for base_type, instance in self._instance_registrations.items():
+            factories[base_type] = lambda instance=instance: instance
+
+        self._factories = factories
+
+    def _guarded_factory(self, base_type: Type[T], factory: Callable[[], T]) -> Callable[[], T]:
+        """
+        Wrap a factory so that re-entrant resolution of the same type is detected.
+
+        Args:
+            base_type: The type the factory creates
+            factory: The registered factory function
+
+        Returns:
+            A callable that invokes the factory
+        """
+        resolving = self._resolving
+
+        def create() -> T:
+            if base_type in resolving:
+                raise ValueError(f"Circular dependency detected while resolving {base_type.__name__}")
+            resolving.add(base_type)
+            try:
+                return factory()
+            finally:
+                resolving.discard(base_type)
+
+        return create
 
     def resolve(self, base_type: Type[T]) -> T:
         """
@@ -60,26 +108,52 @@ class DIContainer:
         Raises:
             ValueError: If the type is not registered or there's a circular dependency
         """
-        # Check for circular dependencies
-        if base_type in self._resolving:
-            raise ValueError(f"Circular dependency detected while resolving {base_type.__name__}")
+        try:
+            factory = self._factories[base_type]
+        except KeyError:
+            factory = self._lookup_after_build(base_type)
 
-        # Check if we have an instance registration
-        if base_type in self._instance_registrations:
-            return self._instance_registrations[base_type]
+        return factory()
 
-        # Check if we have a factory registration
-        if base_type in self._factory_registrations:
-            self._resolving.add(base_type)
-            try:
-                factory = self._factory_registrations[base_type]
-                instance = factory()
-                return instance
-            finally:
-                self._resolving.remove(base_type)
+    def _lookup_after_build(self, base_type: Type[T]) -> Callable[[], T]:
+        """
+        Rebuild the resolution table after a miss and look the type up again.
+
+        Args:
+            base_type: The type to look up
+
+        Returns:
+            The resolution callable for the type
+
+        Raises:
+            ValueError: If the type is not registered
+        """
+        self.build()
+        try:
+            return self._factories[base_type]
+        except KeyError:
+            raise ValueError(f"No registration found for {base_type.__name__}") from None
+
+    def resolve_many(self, base_types: Tuple[Type, ...]) -> Tuple[Any, ...]:
+        """
+        Resolve several types in one call.
+
+        Args:
+            base_types: The types to resolve, in order
+
+        Returns:
+            A tuple of instances in the same order as base_types
+
+        Raises:
+            ValueError: If any type is not registered or there's a circular dependency
+        """
+        factories = self._factories
+        try:
+            selected = [factories[base_type] for base_type in base_types]
+        except KeyError:
+            selected = [self._lookup_after_build(base_type) for base_type in base_types]
 
-        # No registration found
-        raise ValueError(f"No registration found for {base_type.__name__}")
+        return tuple(factory() for factory in selected)
 
     def resolve_all(self, base_type: Type[T]) -> List[T]:
         """
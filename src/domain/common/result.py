@@ -6,10 +6,10 @@ Result pattern implementation for error handling.
 The Result pattern allows methods to return either a success value or a failure with an error message,
 avoiding the need for exceptions for expected error conditions.
 """
-from typing import TypeVar, Generic, Optional, Union, Any, Callable, Dict
+from typing import TypeVar, Generic, Optional, Union, Any, Callable, Dict, Iterator
 
 # Import the new domain error types
-from src.domain.common.errors import DomainError
+from src.domain.common.errors import DomainError, ErrorCategory
 
 T = TypeVar('T')
 U = TypeVar('U')
@@ -38,7 +38,6 @@ class Result(Generic[T]):
 
         # Convert string errors to DomainError
         if isinstance(error, str):
-            from src.domain.common.errors import DomainError, ErrorCategory
             self._error = DomainError(message=error, category=ErrorCategory.UNKNOWN)
         else:
             self._error = error
@@ -110,6 +109,21 @@ class Result(Generic[T]):
             raise ValueError("Cannot access error of a successful result")
         return self._error
 
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Unpack the result as a (success, value_or_error) pair.
+
+        Allows call sites to write ``ok, value = service.call()`` instead of
+        checking is_success and then reading value or error separately.
+
+        Returns:
+            Iterator yielding the success flag, then the value if successful
+            or the error if failed
+        """
+        ok = self._error is None
+        yield ok
+        yield self._value if ok else self._error
+
     def map(self, func: Callable[[T], U]) -> 'Result[U]':
         """
         Transform the result value if successful.
@@ -124,7 +138,6 @@ class Result(Generic[T]):
             try:
                 return Result.ok(func(self._value))
             except Exception as e:
-                from src.domain.common.errors import DomainError
                 return Result.fail(DomainError.from_exception(e))
         else:
             return Result.fail(self._error)
@@ -0,0 +1,30 @@
+"""
+Window information model for a detected trading platform window.
+
+Holds the window handle, title, and owning process of a platform window.
+"""
+from dataclasses import dataclass, asdict
+from typing import Dict, Any
+
+
+@dataclass
+class WindowInfo:
+    """
+    Model representing a detected platform window.
+
+    Attributes:
+        hwnd: Window handle
+        title: Window title text
+        pid: ID of the process that owns the window
+        exe: Executable name of the owning process
+    """
+    __slots__ = ("hwnd", "title", "pid", "exe")
+
+    hwnd: int
+    title: str
+    pid: int
+    exe: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for passing across thread boundaries."""
+        return asdict(self)
@@ -181,6 +181,18 @@ class Worker(Generic[T]):
         """
         pass
 
+    def wait_cancellable(self, seconds: float) -> bool:
+        """
+        Sleep for up to the given time, waking as soon as cancellation is requested.
+
+        Args:
+            seconds: Maximum time to wait in seconds
+
+        Returns:
+            True if cancellation was requested, False if the full time elapsed
+        """
+        return self._cancellation_token.wait(seconds)
+
     def check_cancellation(self) -> None:
         """
         Check if cancellation has been requested and raise exception if so.
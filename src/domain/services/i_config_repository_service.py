@@ -148,6 +148,18 @@ class IConfigRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_snapshot(self) -> Dict[str, Any]:
+        """
+        Get the commonly used settings from a single configuration load.
+
+        Returns:
+            Dictionary with keys "cold_turkey_path", "stop_loss_threshold",
+            "lockout_duration", "current_platform" and "verified_blocks",
+            normalized the same way as the individual getters
+        """
+        pass
+
     @abstractmethod
     def set_stop_loss_threshold(self, value: float) -> Result[bool]:
         """
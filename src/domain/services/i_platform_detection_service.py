@@ -7,9 +7,10 @@ Platform Detection Service Interface
 Defines the contract for detecting and interacting with trading platform windows.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, List, Optional
 import threading
 from src.domain.common.result import Result
+from src.domain.models.window_info import WindowInfo
 
 
 class IPlatformDetectionService(ABC):
@@ -25,7 +26,7 @@ class IPlatformDetectionService(ABC):
 
     @abstractmethod
     def detect_platform_window(self, platform: str, timeout: int = 10,
-                              stop_event: Optional[threading.Event] = None) -> Result[Dict[str, Any]]:
+                              stop_event: Optional[threading.Event] = None) -> Result[WindowInfo]:
         """
         Detect a window for the specified trading platform.
 
@@ -53,12 +54,12 @@ class IPlatformDetectionService(ABC):
         pass
 
     @abstractmethod
-    def is_platform_window_active(self, platform_info: Dict[str, Any]) -> Result[bool]:
+    def is_platform_window_active(self, platform_info: WindowInfo) -> Result[bool]:
         """
         Check if a platform window is currently active (in foreground).
 
         Args:
-            platform_info: Dictionary with platform window information
+            platform_info: Platform window information
 
         Returns:
             Result containing boolean indicating if window is active
@@ -92,7 +93,7 @@ class IPlatformDetectionService(ABC):
         pass
 
     @abstractmethod
-    def activate_platform_windows(self, platform: str) -> Result[bool]:
+    def activate_platform_windows(self, platform: str) -> Result[WindowInfo]:
         """
         Activate all windows associated with a platform.
 
@@ -100,7 +101,8 @@ class IPlatformDetectionService(ABC):
             platform: Platform name
 
         Returns:
-            Result indicating success or failure
+            Result containing information about the window left in the foreground,
+            so callers do not need to detect it again
         """
         pass
 
@@ -270,25 +270,37 @@ class JsonConfigRepository(IConfigRepository):
                 self.logger.error(f"Error loading config: {config_result.error}")
                 return ""
 
-            config = config_result.value
-            current = config.get("current_platform", "")
+            return self._current_platform_from(config_result.value)
 
-            # If current platform is not set, try to determine one
-            if not current:
-                # Try to get from verified blocks
-                verified_blocks = config.get("verified_blocks", [])
-                for block in verified_blocks:
-                    if "platform" in block and block["platform"]:
-                        current = block["platform"]
-                        break
+    @staticmethod
+    def _current_platform_from(config: Dict[str, Any]) -> str:
+        """
+        Determine the current platform from a loaded configuration.
+
+        Args:
+            config: Configuration dictionary
 
-                # If still not set, use first default platform
-                if not current:
-                    default_platforms = config.get("default_platforms", ["Quantower"])
-                    if default_platforms:
-                        current = default_platforms[0]
+        Returns:
+            Current platform name
+        """
+        current = config.get("current_platform", "")
 
-            return current
+        # If current platform is not set, try to determine one
+        if not current:
+            # Try to get from verified blocks
+            verified_blocks = config.get("verified_blocks", [])
+            for block in verified_blocks:
+                if "platform" in block and block["platform"]:
+                    current = block["platform"]
+                    break
+
+            # If still not set, use first default platform
+            if not current:
+                default_platforms = config.get("default_platforms", ["Quantower"])
+                if default_platforms:
+                    current = default_platforms[0]
+
+        return current
 
     def get_all_platforms(self) -> List[str]:
         """
@@ -314,11 +326,15 @@ class JsonConfigRepository(IConfigRepository):
             Stop loss threshold value
         """
         with self._lock:
-            threshold = self.get_global_setting("stop_loss_threshold", 0.0)
-            try:
-                return float(threshold)
-            except (ValueError, TypeError):
-                return 0.0
+            return self._normalize_threshold(self.get_global_setting("stop_loss_threshold", 0.0))
+
+    @staticmethod
+    def _normalize_threshold(threshold: Any) -> float:
+        """Coerce a stored stop loss threshold to a float."""
+        try:
+            return float(threshold)
+        except (ValueError, TypeError):
+            return 0.0
 
     def get_lockout_duration(self) -> int:
         """
@@ -328,16 +344,20 @@ class JsonConfigRepository(IConfigRepository):
             Lockout duration in minutes
         """
         with self._lock:
-            duration = self.get_global_setting("lockout_duration", 15)
-            try:
-                duration = int(duration)
-                if duration < 5:
-                    duration = 5
-                if duration > 720:
-                    duration = 720
-                return duration
-            except (ValueError, TypeError):
-                return 15
+            return self._normalize_duration(self.get_global_setting("lockout_duration", 15))
+
+    @staticmethod
+    def _normalize_duration(duration: Any) -> int:
+        """Coerce a stored lockout duration to an int between 5 and 720 minutes."""
+        try:
+            duration = int(duration)
+            if duration < 5:
+                duration = 5
+            if duration > 720:
+                duration = 720
+            return duration
+        except (ValueError, TypeError):
+            return 15
 
     def get_cold_turkey_path(self) -> str:
         """
@@ -349,6 +369,32 @@ class JsonConfigRepository(IConfigRepository):
         with self._lock:
             return self.get_global_setting("cold_turkey_blocker", "")
 
+    def get_snapshot(self) -> Dict[str, Any]:
+        """
+        Get the commonly used settings from a single configuration load.
+
+        Returns:
+            Dictionary with keys "cold_turkey_path", "stop_loss_threshold",
+            "lockout_duration", "current_platform" and "verified_blocks"
+        """
+        with self._lock:
+            config_result = self.load_config()
+            if config_result.is_failure:
+                self.logger.error(f"Error loading config: {config_result.error}")
+                config = {}
+                current_platform = ""
+            else:
+                config = config_result.value
+                current_platform = self._current_platform_from(config)
+
+            return {
+                "cold_turkey_path": config.get("cold_turkey_blocker", ""),
+                "stop_loss_threshold": self._normalize_threshold(config.get("stop_loss_threshold", 0.0)),
+                "lockout_duration": self._normalize_duration(config.get("lockout_duration", 15)),
+                "current_platform": current_platform,
+                "verified_blocks": list(config.get("verified_blocks", []))
+            }
+
     def set_stop_loss_threshold(self, value: float) -> Result[bool]:
         """
         Set the stop loss threshold.
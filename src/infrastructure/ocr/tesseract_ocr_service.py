@@ -6,6 +6,7 @@ Implementation of the OCR service using Tesseract OCR.
 import os
 import re
 import sys
+import threading
 import cv2
 import numpy as np
 from typing import List
@@ -14,10 +15,25 @@ from PIL import Image, ImageEnhance
 # Import Tesseract binding
 import pytesseract
 
+# pytesseract runs the tesseract executable as a child process, which inherits this
+# environment. OpenMP threading only adds spawn/join overhead on small P&L crops, so
+# run single-threaded unless the user has configured it explicitly.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 from src.domain.services.i_ocr_service import IOcrService
 from src.domain.services.i_logger_service import ILoggerService
 from src.domain.common.result import Result
 
+# Numeric value patterns, compiled once for every OCR pass
+# Dollar values with $ symbol and optional commas - $1,234.56 or $1234.56
+_DOLLAR_PATTERN = re.compile(r'\$([\d,]+\.?\d*)')
+# Negative values in parentheses - (123.45) or ($123.45)
+_NEGATIVE_PATTERN = re.compile(r'\((?:\$)?([\d,]+\.?\d*)\)')
+# Regular numbers with optional decimal point and negative sign - 123.45 or -123.45
+_NUMBER_PATTERN = re.compile(r'(?<!\$)(-?[\d,]+\.?\d*)')
+# Any digit at all; every value the patterns above can parse contains one
+_DIGIT_PATTERN = re.compile(r'\d')
+
 
 class TesseractOcrService(IOcrService):
     """
@@ -27,6 +43,11 @@ class TesseractOcrService(IOcrService):
     and numeric values.
     """
 
+    # Each Tesseract call spawns a CPU-heavy subprocess. The slot count is shared
+    # by every instance (the container builds one per resolve), so concurrent
+    # monitoring, stress-test and UI OCR never oversubscribe the machine.
+    _ocr_slots = threading.BoundedSemaphore(max(1, (os.cpu_count() or 2) // 2))
+
     def __init__(self, logger: ILoggerService):
         """
         Initialize the OCR service.
@@ -100,8 +121,9 @@ class TesseractOcrService(IOcrService):
             # Configure OCR options
             custom_config = '--oem 3 --psm 6'  # OEM 3 = Default engine, PSM 6 = Assume a single uniform block of text
 
-            # Perform OCR
-            extracted_text = pytesseract.image_to_string(processed_image, config=custom_config)
+            # Perform OCR, waiting for a free slot if other threads are already running Tesseract
+            with self._ocr_slots:
+                extracted_text = pytesseract.image_to_string(processed_image, config=custom_config)
 
             # Clean up the extracted text
             extracted_text = extracted_text.strip()
@@ -207,15 +229,20 @@ class TesseractOcrService(IOcrService):
         try:
             self.logger.debug("Extracting numeric values from text")
 
+            # Empty or digit-free OCR output (a blank or unreadable crop) cannot yield values
+            if not text or not _DIGIT_PATTERN.search(text):
+                return Result.ok([])
+
             # Preprocessing - replace common OCR errors
             text = text.replace(';', '.')  # Replace semicolons with periods (common OCR error)
 
             # List to store extracted values
             values = []
 
-            # Pattern 1: Dollar values with $ symbol and optional commas - $1,234.56 or $1234.56
-            dollar_pattern = r'\$([\d,]+\.?\d*)'
-            dollar_matches = re.findall(dollar_pattern, text)
+            # Patterns 1 and 2 need a '$' or '(' to match; a C-level membership test
+            # is far cheaper than a regex sweep over text that cannot match
+            # Pattern 1: Dollar values with $ symbol and optional commas
+            dollar_matches = _DOLLAR_PATTERN.findall(text) if '$' in text else ()
             for match in dollar_matches:
                 try:
                     # Remove commas and convert to float
@@ -225,9 +252,8 @@ class TesseractOcrService(IOcrService):
                 except ValueError:
                     continue
 
-            # Pattern 2: Negative values in parentheses - (123.45) or ($123.45)
-            neg_pattern = r'\((?:\$)?([\d,]+\.?\d*)\)'
-            neg_matches = re.findall(neg_pattern, text)
+            # Pattern 2: Negative values in parentheses
+            neg_matches = _NEGATIVE_PATTERN.findall(text) if '(' in text else ()
             for match in neg_matches:
                 try:
                     # Remove commas, convert to float, and make negative
@@ -241,8 +267,7 @@ class TesseractOcrService(IOcrService):
             # But don't match numbers that are part of larger values already matched
             # This is a secondary pattern that should only be used if no dollar values are found
             if not values:
-                num_pattern = r'(?<!\$)(-?[\d,]+\.?\d*)'
-                num_matches = re.findall(num_pattern, text)
+                num_matches = _NUMBER_PATTERN.findall(text)
                 for match in num_matches:
                     if match.strip() and not match.strip().startswith('$'):
                         try:
@@ -255,7 +280,7 @@ class TesseractOcrService(IOcrService):
 
             # If we have matched multiple partial values that might be fragments of a single value,
             # try to reconstruct the full value if possible
-            if len(values) > 1 and not any('$' in text for _ in text):
+            if len(values) > 1 and '$' not in text:
                 # Check for cases like "96062.0, 50.0" which should be "96062.50"
                 reconstructed = False
                 for i in range(len(values) - 1):
@@ -23,6 +23,7 @@ from src.domain.services.i_platform_detection_service import IPlatformDetectionS
 from src.domain.services.i_config_repository_service import IConfigRepository
 from src.domain.common.result import Result
 from src.domain.common.errors import ValidationError, ConfigurationError, PlatformError
+from src.infrastructure.platform.overlay_window import create_layered_window
 
 # Win32 constants for layered window
 WS_EX_LAYERED = 0x00080000
@@ -104,7 +105,6 @@ class LockoutWorker(Worker[bool]):
             def create_overlay_in_main_thread():
                 nonlocal overlay_created, error_message
                 try:
-                    from src.infrastructure.platform.overlay_window import create_layered_window
                     hwnd = create_layered_window(self.flatten_positions, scr_w, scr_h)
                     if hwnd:
                         self.overlay_hwnd = hwnd
@@ -133,10 +133,7 @@ class LockoutWorker(Worker[bool]):
 
             # Step 4: Wait for 30 seconds (with cancelation support)
             self.report_status(f"Lockout countdown (30s) started for {self.platform}...", "INFO")
-            for i in range(30):
-                if self.cancel_requested:
-                    break
-                time.sleep(1)
+            self.wait_cancellable(30)
 
             # Destroy overlay window
             if self.overlay_hwnd:
@@ -273,10 +270,11 @@ class WindowsLockoutService(ILockoutService):
 
             # Get blocker path
             blocker_path = self.config_repository.get_cold_turkey_path()
-            if not blocker_path or not os.path.exists(blocker_path):
+            blocker_exists = bool(blocker_path) and os.path.exists(blocker_path)
+            if not blocker_exists:
                 error = ConfigurationError(
                     message="Cold Turkey Blocker path not configured or invalid",
-                    details={"path": blocker_path, "exists": os.path.exists(blocker_path) if blocker_path else False}
+                    details={"path": blocker_path, "exists": blocker_exists}
                 )
                 return Result.fail(error)
 
@@ -5,7 +5,9 @@ Implementation of the monitoring service.
 This service coordinates screenshot capture, OCR, and detection of loss thresholds.
 """
 import os
+import random
 import time
+import traceback
 from typing import Tuple, Optional, List, Callable
 from datetime import datetime
 
@@ -27,6 +29,12 @@ class MonitoringWorker(Worker[bool]):
     Worker for monitoring trading platform P&L in a background thread.
     """
 
+    # Retry delay after a failed check doubles per consecutive failure up to the cap;
+    # monitoring stops once BACKOFF_MAX_ATTEMPTS checks in a row have failed
+    BACKOFF_BASE_SECONDS = 0.1
+    BACKOFF_CAP_SECONDS = 5.0
+    BACKOFF_MAX_ATTEMPTS = 3
+
     def __init__(self,
                  platform: str,
                  region: Tuple[int, int, int, int],
@@ -57,6 +65,7 @@ class MonitoringWorker(Worker[bool]):
 
         # Internal state
         self.check_count = 0
+        self.consecutive_failures = 0
         self.platform_window_info = None
         self.last_active = None
 
@@ -74,14 +83,14 @@ class MonitoringWorker(Worker[bool]):
             os.makedirs(self.save_directory, exist_ok=True)
 
             # Get platform window information
-            platform_window_result = self.platform_detection_service.detect_platform_window(
+            ok, platform_window = self.platform_detection_service.detect_platform_window(
                 self.platform, timeout=10)
 
-            if platform_window_result.is_failure:
-                self.report_error(f"Failed to detect {self.platform} window: {platform_window_result.error}")
+            if not ok:
+                self.report_error(f"Failed to detect {self.platform} window: {platform_window}")
                 return False
 
-            self.platform_window_info = platform_window_result.value
+            self.platform_window_info = platform_window
 
             # Main monitoring loop
             while not self.cancel_requested:
@@ -94,16 +103,14 @@ class MonitoringWorker(Worker[bool]):
                     )
 
                     # Check if platform window is active
-                    is_active_result = self.platform_detection_service.is_platform_window_active(
+                    ok, is_active = self.platform_detection_service.is_platform_window_active(
                         self.platform_window_info)
 
-                    if is_active_result.is_failure:
-                        self.report_status(f"Error checking platform activity: {is_active_result.error}", "WARNING")
-                        time.sleep(self.interval_seconds)
+                    if not ok:
+                        self.report_status(f"Error checking platform activity: {is_active}", "WARNING")
+                        self.wait_cancellable(self.interval_seconds)
                         continue
 
-                    is_active = is_active_result.value
-
                     # Report platform activity changes
                     if is_active != self.last_active:
                         if is_active:
@@ -119,6 +126,8 @@ class MonitoringWorker(Worker[bool]):
 
                         # Handle the result
                         if result is not None:
+                            self.consecutive_failures = 0
+
                             # Call the completion callback
                             self.on_check_complete(result)
 
@@ -136,21 +145,20 @@ class MonitoringWorker(Worker[bool]):
                                 "Failed to process monitoring check. See logs for details.",
                                 "ERROR"
                             )
-                            # Optional: Add a short delay before the next attempt
-                            time.sleep(2)
+                            if not self._backoff():
+                                return False
                     else:
                         self.report_status("Platform window is inactive, waiting...", "INFO")
 
-                    # Wait for the next interval, checking for cancellation
-                    for _ in range(int(self.interval_seconds)):
-                        if self.cancel_requested:
-                            break
-                        time.sleep(1)
+                    # Wait for the next interval, waking immediately on cancellation
+                    if self.wait_cancellable(self.interval_seconds):
+                        break
 
                 except Exception as e:
                     self.logger.error(f"Error in monitoring cycle: {str(e)}")
                     self.report_status(f"Error in monitoring cycle: {str(e)}", "ERROR")
-                    time.sleep(2)  # Short delay before retrying
+                    if not self._backoff():
+                        return False
 
             # Check if we were cancelled or completed
             if self.cancel_requested:
@@ -165,6 +173,32 @@ class MonitoringWorker(Worker[bool]):
             self.report_error(f"Monitoring error: {str(e)}")
             return False
 
+    def _backoff(self) -> bool:
+        """
+        Wait before retrying after a failed check.
+
+        The delay doubles with each consecutive failure, capped at
+        BACKOFF_CAP_SECONDS, with a little jitter. The wait ends early if
+        cancellation is requested.
+
+        Returns:
+            True if the check should be retried, False once BACKOFF_MAX_ATTEMPTS
+            consecutive checks have failed (the failure is reported as an error)
+        """
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= self.BACKOFF_MAX_ATTEMPTS:
+            self.report_error(
+                f"Monitoring stopped after {self.consecutive_failures} consecutive failed checks"
+            )
+            return False
+
+        delay = min(self.BACKOFF_CAP_SECONDS,
+                    self.BACKOFF_BASE_SECONDS * 2 ** (self.consecutive_failures - 1))
+        delay += random.uniform(0, 0.05)
+
+        self.wait_cancellable(delay)
+        return True
+
     def _process_check(self) -> Optional[MonitoringResult]:
         """
         Process a single monitoring check.
@@ -180,14 +214,23 @@ class MonitoringWorker(Worker[bool]):
         self.report_status(f"Capturing screenshot (check #{self.check_count})", "INFO")
 
         # Capture screenshot
-        capture_result = self.screenshot_service.capture_and_save(self.region, screenshot_path)
+        capture_result = self.screenshot_service.capture_region(self.region)
         if capture_result.is_failure:
             self.report_status(f"Failed to capture screenshot: {capture_result.error}", "ERROR")
             return None
 
+        image = capture_result.value
+
+        # Keep the file for the record, but OCR the image already in memory
+        # rather than reading and decoding the PNG just written
+        save_result = self.screenshot_service.save_screenshot(image, screenshot_path)
+        if save_result.is_failure:
+            self.report_status(f"Failed to save screenshot to {screenshot_path}: {save_result.error}", "ERROR")
+            return None
+
         # Extract text from screenshot
         self.report_status(f"Extracting text from screenshot", "INFO")
-        extract_result = self.ocr_service.extract_text_from_file(screenshot_path)
+        extract_result = self.ocr_service.extract_text(image)
         if extract_result.is_failure:
             self.report_status(f"Failed to extract text: {extract_result.error}", "ERROR")
             return None
@@ -435,7 +478,6 @@ class MonitoringService(IMonitoringService):
 
         except Exception as e:
             self.logger.error(f"Error in region selection: {e}")
-            import traceback
             self.logger.error(traceback.format_exc())
             return Result.fail(f"Error in region selection: {e}")
 
@@ -506,7 +548,6 @@ class MonitoringService(IMonitoringService):
             threshold_exceeded = min_value < threshold
 
             # Create monitoring result
-            import time
             result = MonitoringResult(
                 values=values,
                 minimum_value=min_value,
@@ -521,6 +562,5 @@ class MonitoringService(IMonitoringService):
 
         except Exception as e:
             self.logger.error(f"Error checking values: {e}")
-            import traceback
             self.logger.debug(traceback.format_exc())
             return Result.fail(f"Error checking values: {e}")
\ No newline at end of file
@@ -175,22 +175,12 @@ def create_layered_window(flatten_positions: List[Dict[str, Any]], screen_w: int
         if not old_obj:
             print("SelectObject failed")
 
-        # Fill bitmap
-        import struct
-
-        # Helper function to fill a rectangle with a specific alpha value
-        def fill_rect_alpha(x1, y1, x2, y2, alpha, color=(0, 0, 0)):
-            b, g, r = color
-            for yy in range(y1, y2):
-                for xx in range(x1, x2):
-                    offset = ((screen_h - 1 - yy) * screen_w + xx) * 4
-                    pixel = struct.pack("BBBB", b, g, r, alpha)
-                    ctypes.memmove(ppvBits.value + offset, pixel, 4)
-
-        # First fill entire screen with alpha_block
-        fill_rect_alpha(0, 0, screen_w, screen_h, alpha_block, (0, 0, 0))
-
-        # Carve out holes for flatten buttons
+        # Fill bitmap. Build the whole BGRA buffer in Python with bulk byte operations,
+        # then copy it into the DIB once, instead of packing and copying pixel by pixel.
+        stride = screen_w * 4
+        pixels = bytearray(bytes((0, 0, 0, alpha_block)) * (screen_w * screen_h))
+
+        # Carve out fully transparent holes for flatten buttons
         for pos in flatten_positions:
             coords = pos.get("coords")
             if coords:
@@ -199,7 +189,20 @@ def create_layered_window(flatten_positions: List[Dict[str, Any]], screen_w: int
                     x1, x2 = x2, x1
                 if y2 < y1:
                     y1, y2 = y2, y1
-                fill_rect_alpha(x1, y1, x2, y2, 0, (0, 0, 0))
+
+                # Clip to the overlay so off-screen coordinates cannot write past the bitmap
+                x1, x2 = max(0, x1), min(screen_w, x2)
+                y1, y2 = max(0, y1), min(screen_h, y2)
+                if x1 >= x2 or y1 >= y2:
+                    continue
+
+                hole_row = bytes((x2 - x1) * 4)
+                for yy in range(y1, y2):
+                    # DIB rows are stored bottom-up
+                    offset = (screen_h - 1 - yy) * stride + x1 * 4
+                    pixels[offset:offset + len(hole_row)] = hole_row
+
+        ctypes.memmove(ppvBits.value, (ctypes.c_char * len(pixels)).from_buffer(pixels), len(pixels))
 
         # Update layered window
         sizeWin = SIZE(screen_w, screen_h)
@@ -7,7 +7,7 @@ from PIL import Image
 import io
 import os
 
-from PySide6.QtCore import QByteArray, QBuffer, QRect
+from PySide6.QtCore import QRect
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPixmap, QImage
 
@@ -119,17 +119,24 @@ class QtScreenshotService(IScreenshotService):
             ))
 
     def _qpixmap_to_pil(self, pixmap: QPixmap) -> Optional[Image.Image]:
-        """Convert QPixmap to PIL Image using an intermediate buffer."""
+        """Convert QPixmap to PIL Image by copying its raw pixel rows."""
         try:
-            # Save QPixmap to a byte array in PNG format
-            byte_array = QByteArray()
-            buffer = QBuffer(byte_array)
-            buffer.open(QBuffer.WriteOnly)
-            pixmap.save(buffer, "PNG")
-            buffer.close()
-
-            # Load byte data into PIL Image
-            return Image.open(io.BytesIO(byte_array.data()))
+            # Copy pixels straight across instead of encoding and decoding a PNG
+            if pixmap.hasAlphaChannel():
+                qimage = pixmap.toImage().convertToFormat(QImage.Format_RGBA8888)
+                mode = "RGBA"
+            else:
+                qimage = pixmap.toImage().convertToFormat(QImage.Format_RGB888)
+                mode = "RGB"
+
+            return Image.frombytes(
+                mode,
+                (qimage.width(), qimage.height()),
+                bytes(qimage.constBits()),
+                "raw",
+                mode,
+                qimage.bytesPerLine()
+            )
         except Exception as e:
             self.logger.error(f"Error converting QPixmap to PIL Image: {e}")
             return None
@@ -145,17 +152,21 @@ class QtScreenshotService(IScreenshotService):
             Result containing the QPixmap on success
         """
         try:
-            image_bytes = self._image_to_bytes(image)
-            if isinstance(image_bytes, Result):
-                if image_bytes.is_failure:
-                    return image_bytes
-                image_bytes = image_bytes.value
+            # Hand the raw pixel buffer to Qt; no PNG encode/decode in between
+            if image.mode == "RGB":
+                image_format = QImage.Format_RGB888
+            else:
+                image = image.convert("RGBA")
+                image_format = QImage.Format_RGBA8888
 
-            # Create and load the QPixmap directly from bytes
-            pixmap = QPixmap()
-            success = pixmap.loadFromData(image_bytes)
+            data = image.tobytes("raw", image.mode)
+            bytes_per_line = len(data) // image.height if image.height else 0
+            qimage = QImage(data, image.width, image.height, bytes_per_line, image_format)
 
-            if not success or pixmap.isNull():
+            # fromImage copies the pixels, so data only needs to outlive this call
+            pixmap = QPixmap.fromImage(qimage)
+
+            if pixmap.isNull():
                 return Result.fail(ResourceError(
                     message="Failed to convert image to QPixmap",
                     details={"image_size": f"{image.width}x{image.height}"}
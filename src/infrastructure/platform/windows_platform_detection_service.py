@@ -6,7 +6,7 @@ Implements platform detection services using Windows-specific APIs.
 import time
 import psutil
 import threading
-from typing import Dict, Any, List, Optional
+from typing import Dict, List, Optional
 
 import win32gui
 import win32con
@@ -17,6 +17,7 @@ from src.domain.services.i_logger_service import ILoggerService
 from src.domain.common.result import Result
 from src.domain.services.i_window_manager_service import IWindowManager
 from src.domain.common.errors import PlatformError
+from src.domain.models.window_info import WindowInfo
 
 
 class WindowsPlatformDetectionService(IPlatformDetectionService):
@@ -47,7 +48,7 @@ class WindowsPlatformDetectionService(IPlatformDetectionService):
         }
 
     def detect_platform_window(self, platform: str, timeout: int = 10,
-                               stop_event: Optional[threading.Event] = None) -> Result[Dict[str, Any]]:
+                               stop_event: Optional[threading.Event] = None) -> Result[WindowInfo]:
         """Detect a window for the specified trading platform."""
         # Validate platform name
         if platform not in self._target_executables:
@@ -101,21 +102,17 @@ class WindowsPlatformDetectionService(IPlatformDetectionService):
                         hwnd = hwnd_result.value
                         if hwnd:
                             try:
-                                # Create a deep copy of all data to avoid Win32 handle problems
-                                title = str(win32gui.GetWindowText(hwnd))
-
-                                # Create a completely new dictionary with basic Python types
-                                detected_info = {
-                                    "hwnd": int(hwnd),  # Convert to integer
-                                    "title": str(title),  # Convert to string
-                                    "pid": int(safe_pid),  # Convert to integer
-                                    "exe": str(proc.info['name'])  # Convert to string
-                                }
+                                # Copy all data into basic Python types to avoid Win32 handle problems
+                                detected_info = WindowInfo(
+                                    hwnd=int(hwnd),
+                                    title=str(win32gui.GetWindowText(hwnd)),
+                                    pid=int(safe_pid),
+                                    exe=str(proc.info['name'])
+                                )
 
                                 self.logger.info(f"Detected {platform} window: {detected_info}")
 
-                                # Return a new dictionary to avoid any reference issues
-                                return Result.ok(detected_info.copy())
+                                return Result.ok(detected_info)
                             except Exception as e:
                                 self.logger.debug(f"Error getting window title for hwnd {hwnd}: {e}")
                                 continue
@@ -136,6 +133,7 @@ class WindowsPlatformDetectionService(IPlatformDetectionService):
             details={"platform": platform}
         )
         return Result.fail(error)
+
     def get_window_by_pid(self, pid: int) -> Result[Optional[int]]:
         """
         Get window handle associated with a process ID.
@@ -150,7 +148,6 @@ class WindowsPlatformDetectionService(IPlatformDetectionService):
             # Use the window manager abstraction
             return self.window_manager.find_window_by_process_id(pid)
         except Exception as e:
-            from src.domain.common.errors import PlatformError
             error = PlatformError(
                 message=f"Failed to get window by PID {pid}",
                 details={"pid": pid},
@@ -159,12 +156,12 @@ class WindowsPlatformDetectionService(IPlatformDetectionService):
             self.logger.error(str(error))
             return Result.fail(error)
 
-    def is_platform_window_active(self, platform_info: Dict[str, Any]) -> Result[bool]:
+    def is_platform_window_active(self, platform_info: WindowInfo) -> Result[bool]:
         """
         Check if a platform window is currently active (in foreground).
 
         Args:
-            platform_info: Dictionary with platform window information
+            platform_info: Platform window information
 
         Returns:
             Result containing boolean indicating if window is active
@@ -188,7 +185,7 @@ class WindowsPlatformDetectionService(IPlatformDetectionService):
             active_pid = active_pid_result.value
 
             # Get PID of target platform window
-            target_pid = platform_info.get("pid")
+            target_pid = platform_info.pid
 
             self.logger.debug(f"Active window PID: {active_pid}, Target window PID: {target_pid}")
 
@@ -273,7 +270,7 @@ class WindowsPlatformDetectionService(IPlatformDetectionService):
             self.logger.warning(f"Failed to force foreground for window {hwnd}: {e}")
             return Result.fail(f"Failed to force foreground for window {hwnd}: {e}")
 
-    def activate_platform_windows(self, platform: str) -> Result[bool]:
+    def activate_platform_windows(self, platform: str) -> Result[WindowInfo]:
         """
         Activate all windows associated with a platform.
 
@@ -281,7 +278,8 @@ class WindowsPlatformDetectionService(IPlatformDetectionService):
             platform: Platform name
 
         Returns:
-            Result indicating success or failure
+            Result containing information about the last window activated, which
+            is the one left in the foreground
         """
         try:
             if platform not in self._target_executables:
@@ -289,6 +287,7 @@ class WindowsPlatformDetectionService(IPlatformDetectionService):
 
             target_exe = self._target_executables[platform]
             activated_count = 0
+            last_activated = None
 
             # First find processes matching target executable
             matching_processes = []
@@ -296,7 +295,7 @@ class WindowsPlatformDetectionService(IPlatformDetectionService):
                 for proc in psutil.process_iter(['pid', 'name']):
                     try:
                         if proc.info['name'] and proc.info['name'].lower() == target_exe.lower():
-                            matching_processes.append(proc.info['pid'])
+                            matching_processes.append((proc.info['pid'], proc.info['name']))
                     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                         continue
             except Exception as e:
@@ -304,7 +303,7 @@ class WindowsPlatformDetectionService(IPlatformDetectionService):
                 # Continue with any processes we found
 
             # Now try to activate windows for these processes
-            for pid in matching_processes:
+            for pid, exe in matching_processes:
                 try:
                     windows_result = self.get_all_windows_for_pid(pid)
 
@@ -317,6 +316,7 @@ class WindowsPlatformDetectionService(IPlatformDetectionService):
                             force_result = self.force_foreground_window(hwnd)
                             if force_result.is_success:
                                 activated_count += 1
+                                last_activated = (hwnd, pid, exe)
                         except Exception as e:
                             self.logger.warning(f"Error activating window {hwnd}: {e}")
                 except Exception as e:
@@ -325,7 +325,13 @@ class WindowsPlatformDetectionService(IPlatformDetectionService):
 
             if activated_count > 0:
                 self.logger.info(f"Activated {activated_count} windows for platform {platform}")
-                return Result.ok(True)
+                hwnd, pid, exe = last_activated
+                return Result.ok(WindowInfo(
+                    hwnd=int(hwnd),
+                    title=str(win32gui.GetWindowText(hwnd)),
+                    pid=int(pid),
+                    exe=str(exe)
+                ))
             else:
                 self.logger.warning(f"No windows found to activate for platform {platform}")
                 return Result.fail(f"No windows found to activate for platform {platform}")
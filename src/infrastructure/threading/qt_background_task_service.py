@@ -2,14 +2,15 @@
 """
 Qt implementation of the thread service.
 
-This module provides a thread service implementation using Qt's QThread for
-safely executing background tasks without blocking the UI.
+This module provides a thread service implementation using a shared QThreadPool
+for safely executing background tasks without blocking the UI.
 """
+import os
+import threading
 import traceback
 from typing import Dict, Any, Optional, Callable, List, TypeVar
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QObject, QThread, Signal, Slot, Qt, QMutex, QMutexLocker, QTimer, QEventLoop
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Qt, QMutex, QMutexLocker, QTimer, QEventLoop
 
 from src.domain.services.i_background_task_service import IBackgroundTaskService, Worker
 from src.domain.services.i_logger_service import ILoggerService
@@ -34,9 +35,9 @@ class WorkerSignals(QObject):
     error = Signal(str)
 
 
-class WorkerWrapper(QObject):
+class WorkerWrapper(QRunnable):
     """
-    Qt wrapper for Worker objects to run in a QThread.
+    Qt wrapper for Worker objects to run on a QThreadPool.
 
     This class bridges between the domain Worker interface and Qt's threading model,
     ensuring thread-safe communication via signals and slots.
@@ -57,6 +58,12 @@ class WorkerWrapper(QObject):
         self.task_id = task_id
         self.signals = WorkerSignals()
 
+        # The service keeps its own reference, so the pool must not delete us
+        self.setAutoDelete(False)
+
+        # Set once run() returns, so cancellation can wait for the pool thread
+        self.finished = threading.Event()
+
         # Store original callbacks
         self.original_started_callback = worker.on_started_callback
         self.original_progress_callback = worker.on_progress_callback
@@ -71,11 +78,10 @@ class WorkerWrapper(QObject):
         # We don't set completed callback directly to avoid circular references
         # Instead, we'll emit our completed signal in _process_and_emit_result
 
-    @Slot()
     def run(self):
         """
         Execute the worker's task in the background thread.
-        This method is called automatically when the thread starts.
+        This method is called automatically when the pool picks up the task.
         """
         try:
             self.logger.debug(f"Worker for task '{self.task_id}' starting execution")
@@ -88,6 +94,8 @@ class WorkerWrapper(QObject):
             self.logger.error(error_message)
             self.logger.debug(traceback.format_exc())
             self.worker.report_error(error_message)
+        finally:
+            self.finished.set()
 
     def _process_and_emit_result(self, result):
         """
@@ -137,22 +145,20 @@ class TaskInfo:
     """
     Stores information about a running task.
 
-    Maintains references to threads, wrappers, and workers for a specific task,
+    Maintains references to wrappers and workers for a specific task,
     along with metadata and state information.
     """
 
-    def __init__(self, task_id: str, thread: QThread, wrapper: WorkerWrapper, worker: Worker):
+    def __init__(self, task_id: str, wrapper: WorkerWrapper, worker: Worker):
         """
         Initialize task information.
 
         Args:
             task_id: Unique identifier for the task
-            thread: QThread instance running the task
-            wrapper: WorkerWrapper bridging the worker to the thread
+            wrapper: WorkerWrapper bridging the worker to the thread pool
             worker: The worker being executed
         """
         self.task_id = task_id
-        self.thread = thread
         self.wrapper = wrapper
         self.worker = worker
 
@@ -175,10 +181,14 @@ class QtBackgroundTaskService(IBackgroundTaskService):
     """
     Qt implementation of thread service for managing background tasks.
 
-    Uses Qt's QThread and signal/slot mechanism to safely execute
-    tasks in background threads without blocking the UI.
+    Uses a shared QThreadPool and Qt's signal/slot mechanism to safely execute
+    tasks in background threads without blocking the UI. Pool threads are reused
+    across tasks instead of creating and tearing down a QThread per task.
     """
 
+    # How long cancellation waits for workers to notice and return
+    CANCEL_WAIT_SECONDS = 1.25
+
     def __init__(self, logger: ILoggerService):
         """
         Initialize the Qt thread service.
@@ -190,6 +200,11 @@ class QtBackgroundTaskService(IBackgroundTaskService):
         self.tasks: Dict[str, TaskInfo] = {}
         self.mutex = QMutex()  # Simple mutex for thread safety
 
+        # Dedicated pool so long-running tasks never starve QThreadPool.globalInstance().
+        # The limit is fixed; tasks beyond it queue until a thread frees up.
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max(2, (os.cpu_count() or 2) - 1))
+
     def execute_task(self, task_id: str, worker: Worker[T]) -> Result[bool]:
         """
         Execute a worker in a background thread.
@@ -211,19 +226,8 @@ class QtBackgroundTaskService(IBackgroundTaskService):
 
             self.logger.debug(f"Starting task '{task_id}'")
 
-            # Create QThread
-            thread = QThread()
-
             # Create worker wrapper
             wrapper = WorkerWrapper(worker, self.logger, task_id)
-            wrapper.moveToThread(thread)
-
-            # Connect thread lifecycle signals
-            thread.started.connect(wrapper.run)
-
-            # Use deleteLater to ensure proper cleanup when thread finishes
-            thread.finished.connect(thread.deleteLater)
-            thread.finished.connect(wrapper.deleteLater)
 
             # Connect worker callbacks with Qt.QueuedConnection for thread safety
             # This ensures callbacks are executed in the thread that created the connection
@@ -237,10 +241,10 @@ class QtBackgroundTaskService(IBackgroundTaskService):
                 wrapper.signals.error.connect(worker.on_error_callback, Qt.QueuedConnection)
 
             # Store task info
-            self.tasks[task_id] = TaskInfo(task_id, thread, wrapper, worker)
+            self.tasks[task_id] = TaskInfo(task_id, wrapper, worker)
 
-            # Start thread
-            thread.start()
+            # Hand it to an idle thread, or queue it if every thread is busy
+            self.pool.start(wrapper)
 
             self.logger.debug(f"Task '{task_id}' started successfully")
             return Result.ok(True)
@@ -351,32 +355,16 @@ class QtBackgroundTaskService(IBackgroundTaskService):
                 return Result.fail(f"Task '{task_id}' not found")
 
             self.logger.debug(f"Cancelling task '{task_id}'")
-            task_info = self.tasks[task_id]
+            task_info = self.tasks.pop(task_id)
+            self._request_cancel(task_info)
+            locker.unlock()
 
-            # Request cancellation on the worker first
-            task_info.worker.cancel()
-
-            # Clean up signals to prevent memory leaks
-            task_info.disconnect_signals()
-
-            # Quit the thread
-            task_info.thread.quit()
-
-            # Try graceful termination with multiple attempts
-            for attempt in range(5):  # Try multiple times before force termination
-                if task_info.thread.wait(250):  # 250ms × 5 attempts = 1.25s total max wait
-                    break
-                # Process events to allow signals to flow and thread to finish cleanly
-                QApplication.instance().processEvents()
-
-            # Only force terminate if graceful methods failed
-            if not task_info.thread.isFinished():
-                self.logger.warning(f"Forcing termination of task '{task_id}'")
-                task_info.thread.terminate()
-                task_info.thread.wait(500)
-
-            # Remove task
-            del self.tasks[task_id]
+            # Give the worker a chance to notice cancellation and return. The lock is
+            # released first so other threads can start, query and finish tasks meanwhile.
+            # Its signals are already disconnected, so there is nothing to pump.
+            if not task_info.wrapper.finished.wait(self.CANCEL_WAIT_SECONDS):
+                # Pool threads cannot be terminated; the worker finishes in the background
+                self.logger.warning(f"Task '{task_id}' did not stop in time and will finish in the background")
 
             self.logger.debug(f"Task '{task_id}' cancelled successfully")
             return Result.ok(True)
@@ -418,19 +406,61 @@ class QtBackgroundTaskService(IBackgroundTaskService):
             pass
 
     def cancel_all_tasks(self) -> None:
-        """Cancel all running background tasks."""
-        task_ids = []
+        """
+        Cancel all running background tasks.
 
-        # Get all task IDs with the lock
+        Every task is signalled before any is waited on, anything still queued is
+        dropped from the pool, and the pool is then drained for at most
+        CANCEL_WAIT_SECONDS in total rather than that long per task. The wait
+        happens after self.mutex is released.
+        """
         locker = QMutexLocker(self.mutex)
+
         try:
-            task_ids = list(self.tasks.keys())
-        finally:
-            locker.unlock()  # Unlock before calling cancel_task to avoid deadlock
+            # Snapshot and detach the tasks under the lock, signalling every one first
+            # so they all wind down in parallel
+            tasks = list(self.tasks.items())
+            self.tasks.clear()
+            for _, task_info in tasks:
+                self._request_cancel(task_info)
+
+            # Drop untracked queued work too
+            self.pool.clear()
+            locker.unlock()
+
+            if not tasks:
+                return
+
+            self.logger.debug(f"Cancelling {len(tasks)} task(s)")
+
+            # Wait for the running workers to return without blocking other callers
+            self.pool.waitForDone(int(self.CANCEL_WAIT_SECONDS * 1000))
+
+            for task_id, task_info in tasks:
+                if not task_info.wrapper.finished.is_set():
+                    self.logger.warning(f"Task '{task_id}' did not stop in time and will finish in the background")
+        except Exception as e:
+            self.logger.error(f"Error cancelling tasks: {e}")
+            self.logger.debug(traceback.format_exc())
+
+    def _request_cancel(self, task_info: TaskInfo) -> None:
+        """
+        Ask a task to stop without waiting for it.
+
+        Must be called with self.mutex held.
+
+        Args:
+            task_info: Task to cancel
+        """
+        # Request cancellation on the worker first
+        task_info.worker.cancel()
 
-        # Cancel each task (cancel_task will acquire its own lock)
-        for task_id in task_ids:
-            self.cancel_task(task_id)
+        # Clean up signals to prevent memory leaks
+        task_info.disconnect_signals()
+
+        # A task still queued behind others can simply be dropped from the pool
+        if self.pool.tryTake(task_info.wrapper):
+            task_info.wrapper.finished.set()
 
     def wait_for_task(self, task_id: str, timeout_ms: int = 30000) -> Result[bool]:
         """
@@ -446,10 +476,19 @@ class QtBackgroundTaskService(IBackgroundTaskService):
         Returns:
             Result indicating whether the task completed successfully
         """
-        if not self.is_task_running(task_id):
+        locker = QMutexLocker(self.mutex)
+        task_info = self.tasks.get(task_id)
+        locker.unlock()
+
+        if task_info is None:
             return Result.ok(False)  # Task is not running
 
         try:
+            # A task still queued behind a full pool (e.g. one waited on from inside
+            # another pool task) runs here instead of waiting for a free thread
+            if self.pool.tryTake(task_info.wrapper):
+                task_info.wrapper.run()
+
             # Create an event loop for waiting
             wait_loop = QEventLoop()
 
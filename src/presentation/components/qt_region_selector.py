@@ -121,11 +121,12 @@ class QtRegionSelector(QMainWindow):
             # Fallback to QGuiApplication for Qt6
             screens = QGuiApplication.screens()
             if len(screens) > 1:
-                # Combine geometries of all screens
-                left = min(screen.geometry().left() for screen in screens)
-                top = min(screen.geometry().top() for screen in screens)
-                right = max(screen.geometry().right() for screen in screens)
-                bottom = max(screen.geometry().bottom() for screen in screens)
+                # Combine geometries of all screens, fetching each geometry once
+                geometries = [screen.geometry() for screen in screens]
+                left = min(geometry.left() for geometry in geometries)
+                top = min(geometry.top() for geometry in geometries)
+                right = max(geometry.right() for geometry in geometries)
+                bottom = max(geometry.bottom() for geometry in geometries)
                 self.screen_geometry = QRect(left, top, right - left, bottom - top)
             else:
                 self.screen_geometry = QGuiApplication.primaryScreen().geometry()
@@ -374,40 +375,27 @@ def select_region_qt(message="Select a region by clicking and dragging") -> Opti
         if dialog.exec() != QDialog.Accepted:
             return None
 
-        # Process events to ensure dialog is fully closed
-        app.processEvents()
-
         # Create region selector
         selected_region = None
-        selection_done = False
-
         selector = QtRegionSelector()
 
-        # Connect signals
+        # The selector's signals end the wait directly; no polling or manual event pumping
+        loop = QEventLoop()
+
         def on_region_selected(region):
-            nonlocal selected_region, selection_done
+            nonlocal selected_region
             selected_region = region
-            selection_done = True
-
-        def on_selection_cancelled():
-            nonlocal selection_done
-            selection_done = True
+            loop.quit()
 
         selector.region_selected.connect(on_region_selected)
-        selector.selection_cancelled.connect(on_selection_cancelled)
+        selector.selection_cancelled.connect(loop.quit)
 
         # Show selector
         selector.show()
         selector.activateWindow()
 
-        # Wait for selection to complete using QEventLoop instead of sleep
-        loop = QEventLoop()
-        timer = QTimer()
-        timer.setInterval(50)  # 50ms checks
-        timer.timeout.connect(lambda: loop.quit() if selection_done else None)
-        timer.start()
-        loop.exec()  # Much more responsive than sleep approach
-        timer.stop()
+        # Block here, still serving the event queue, until a selection signal arrives
+        loop.exec()
 
         return selected_region
 
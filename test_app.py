@@ -6,11 +6,15 @@ This test application validates the threading implementation of various
 components in the MonitorPal application, ensuring they function correctly
 and efficiently in a multi-threaded environment.
 """
-import os
+import html
+import random
 import sys
+import threading
 import time
+import traceback
 from datetime import datetime
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, List
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -18,12 +22,9 @@ from PySide6.QtWidgets import (
     QFileDialog, QComboBox, QSpinBox, QGroupBox
 )
 from PySide6.QtCore import Qt, QTimer, Signal, QObject
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QPixmap, QTextCursor
 
 # Import your MonitorPal components
-# Ensure the NewLayout package is in the Python path
-sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
-
 from src.domain.services.i_logger_service import ILoggerService
 from src.domain.services.i_background_task_service import IBackgroundTaskService, Worker
 from src.domain.services.i_config_repository_service import IConfigRepository
@@ -34,12 +35,49 @@ from src.domain.services.i_monitoring_service import IMonitoringService
 from src.domain.services.i_lockout_service import ILockoutService
 from src.domain.services.i_verification_service import IVerificationService
 from src.domain.services.i_window_manager_service import IWindowManager
+from src.domain.common.result import Result
 from src.application.app import initialize_app
+from src.presentation.components.qt_region_selector import select_region_qt
+
+
+# Span template per log level with the colour baked in; INFO is written without a span,
+# unknown levels are dropped
+_LOG_TEMPLATES = MappingProxyType({
+    level: f"<span style='color:{color}'>%s</span>"
+    for level, color in (
+        ("WARNING", "orange"),
+        ("ERROR", "red"),
+        ("SUCCESS", "green"),
+    )
+})
+
+
+# Oldest lines are dropped past this many, so long sessions keep layout and memory bounded
+_LOG_MAX_BLOCKS = 2000
+
+
+# Largest preview shown on the screenshot tab; bigger captures are downscaled by the worker
+_PREVIEW_MAX_SIZE = (800, 600)
+
+
+def _format_log_line(message, level):
+    """Format a log line for a rich-text log, or return None for unknown levels."""
+    # Messages are plain text from services; escape them so Qt does not parse them as markup
+    if level == "INFO":
+        return html.escape(message, quote=False)
+    template = _LOG_TEMPLATES.get(level)
+    if template is None:
+        return None
+    return template % html.escape(message, quote=False)
 
 
 class TestSignals(QObject):
     """Signals for the test application."""
     log_message = Signal(str, str)  # message, level
+    # Monitoring callbacks fire on the monitoring worker thread; these carry them to the UI thread
+    monitoring_status = Signal(str, str)  # message, level
+    monitoring_threshold_exceeded = Signal(object)  # MonitoringResult
+    monitoring_error = Signal(str)
 
 
 class SleepWorker(Worker[Dict[str, Any]]):
@@ -73,7 +111,7 @@ class SleepWorker(Worker[Dict[str, Any]]):
                 self.report_progress(progress, f"{self.name} progress: {progress}%")
 
                 # Sleep for a small interval
-                time.sleep(min(step_time, 0.1))
+                self.wait_cancellable(min(step_time, 0.1))
 
             # Final elapsed time
             elapsed = time.time() - start_time
@@ -89,6 +127,535 @@ class SleepWorker(Worker[Dict[str, Any]]):
             return {"completed": False, "error": str(e), "name": self.name}
 
 
+class ThreadStressWorker(Worker[Dict[str, Any]]):
+    """Worker that sleeps for random intervals until cancelled."""
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        results = []
+
+        # Run until cancelled or the stress test completes
+        while not self.cancel_requested:
+            try:
+                # Random sleep duration
+                duration = random.uniform(0.1, 1.0)
+
+                # Sleep, waking early if cancelled
+                if self.wait_cancellable(duration):
+                    break
+
+                # Report progress
+                self.report_progress(50, f"Iteration completed with duration {duration:.2f}")
+
+                # Add to results
+                results.append(duration)
+
+                # Occasionally report error to test error handling
+                if random.random() < 0.05:  # 5% chance
+                    self.report_error(f"Random error in iteration {len(results)}")
+            except Exception as e:
+                self.report_error(f"Exception in thread stress task: {e}")
+
+        return {
+            "iterations": len(results),
+            "total_duration": sum(results),
+            "avg_duration": sum(results) / len(results) if results else 0
+        }
+
+
+class ConfigStressWorker(Worker[Dict[str, Any]]):
+    """Worker that alternates config loads and saves until cancelled."""
+
+    def __init__(self, config_repo: IConfigRepository, index: int):
+        """Initialize the config stress worker."""
+        super().__init__()
+        self.config_repo = config_repo
+        self.index = index
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        results = {"loads": 0, "saves": 0, "load_errors": 0, "save_errors": 0}
+
+        # Run until cancelled or the stress test completes
+        while not self.cancel_requested:
+            try:
+                # Alternate between load and save
+                if results["loads"] <= results["saves"]:
+                    # Load config
+                    config_result = self.config_repo.load_config(force_reload=True)
+                    if config_result.is_failure:
+                        results["load_errors"] += 1
+                        self.report_error(f"Load error: {config_result.error}")
+                    else:
+                        results["loads"] += 1
+                else:
+                    # Save config with a unique test value
+                    config_result = self.config_repo.load_config()
+                    if config_result.is_failure:
+                        results["load_errors"] += 1
+                        self.report_error(f"Load error before save: {config_result.error}")
+                    else:
+                        config = config_result.value
+                        config[f"stress_test_{self.index}_{results['saves']}"] = time.time()
+
+                        save_result = self.config_repo.save_config(config)
+                        if save_result.is_failure:
+                            results["save_errors"] += 1
+                            self.report_error(f"Save error: {save_result.error}")
+                        else:
+                            results["saves"] += 1
+
+                # Small delay to prevent too rapid operations
+                self.wait_cancellable(0.1)
+
+            except Exception as e:
+                self.report_error(f"Exception in config stress task: {e}")
+
+        return results
+
+
+class ScreenshotStressWorker(Worker[Dict[str, Any]]):
+    """Worker that captures a region repeatedly until cancelled."""
+
+    def __init__(self, screenshot_service: IScreenshotService, region):
+        """Initialize the screenshot stress worker."""
+        super().__init__()
+        self.screenshot_service = screenshot_service
+        self.region = region
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        results = {"captures": 0, "errors": 0, "total_time": 0}
+
+        # Run until cancelled or the stress test completes
+        while not self.cancel_requested:
+            try:
+                # Time the capture
+                start_time = time.time()
+
+                # Capture screenshot
+                capture_result = self.screenshot_service.capture_region(self.region)
+
+                # Calculate time
+                capture_time = time.time() - start_time
+                results["total_time"] += capture_time
+
+                if capture_result.is_failure:
+                    results["errors"] += 1
+                    self.report_error(f"Capture error: {capture_result.error}")
+                else:
+                    results["captures"] += 1
+
+                    # Report occasional progress
+                    if results["captures"] % 10 == 0:
+                        self.report_progress(
+                            50,
+                            f"Completed {results['captures']} captures, avg time: {results['total_time']/results['captures']:.3f}s"
+                        )
+
+                # Small delay to prevent too rapid operations
+                self.wait_cancellable(0.1)
+
+            except Exception as e:
+                self.report_error(f"Exception in screenshot stress task: {e}")
+
+        # Calculate average time
+        avg_time = results["total_time"] / results["captures"] if results["captures"] > 0 else 0
+        results["avg_time"] = avg_time
+
+        return results
+
+
+class OcrStressWorker(Worker[Dict[str, Any]]):
+    """Worker that captures a region and runs OCR on it until cancelled."""
+
+    def __init__(self, screenshot_service: IScreenshotService, ocr_service: IOcrService, region):
+        """Initialize the OCR stress worker."""
+        super().__init__()
+        self.screenshot_service = screenshot_service
+        self.ocr_service = ocr_service
+        self.region = region
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        results = {"ocr_operations": 0, "errors": 0, "total_time": 0}
+
+        # Run until cancelled or the stress test completes
+        while not self.cancel_requested:
+            try:
+                # Capture screenshot
+                capture_result = self.screenshot_service.capture_region(self.region)
+
+                if capture_result.is_failure:
+                    results["errors"] += 1
+                    self.report_error(f"Capture error: {capture_result.error}")
+                    continue
+
+                image = capture_result.value
+
+                # Time the OCR operation
+                start_time = time.time()
+
+                # Perform OCR
+                ocr_result = self.ocr_service.extract_text(image)
+
+                # Calculate time
+                ocr_time = time.time() - start_time
+                results["total_time"] += ocr_time
+
+                if ocr_result.is_failure:
+                    results["errors"] += 1
+                    self.report_error(f"OCR error: {ocr_result.error}")
+                else:
+                    results["ocr_operations"] += 1
+
+                    # Report occasional progress
+                    if results["ocr_operations"] % 5 == 0:
+                        self.report_progress(
+                            50,
+                            f"Completed {results['ocr_operations']} OCR ops, avg time: {results['total_time']/results['ocr_operations']:.3f}s"
+                        )
+
+                # Larger delay for OCR to prevent overwhelming the CPU
+                self.wait_cancellable(0.5)
+
+            except Exception as e:
+                self.report_error(f"Exception in OCR stress task: {e}")
+
+        # Calculate average time
+        avg_time = results["total_time"] / results["ocr_operations"] if results["ocr_operations"] > 0 else 0
+        results["avg_time"] = avg_time
+
+        return results
+
+
+class LoadConfigWorker(Worker[Dict[str, Any]]):
+    """Worker that force-reloads the configuration once."""
+
+    def __init__(self, config_repo: IConfigRepository):
+        """Initialize the load config worker."""
+        super().__init__()
+        self.config_repo = config_repo
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        config_result = self.config_repo.load_config(force_reload=True)
+        if config_result.is_failure:
+            return {"success": False, "error": str(config_result.error)}
+        return {"success": True, "config": config_result.value}
+
+
+class SaveConfigWorker(Worker[Dict[str, Any]]):
+    """Worker that saves the configuration with a fresh test timestamp."""
+
+    def __init__(self, config_repo: IConfigRepository):
+        """Initialize the save config worker."""
+        super().__init__()
+        self.config_repo = config_repo
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        # Get current config
+        config_result = self.config_repo.load_config()
+        if config_result.is_failure:
+            return {"success": False, "error": str(config_result.error)}
+
+        # Update a value to ensure a change
+        config = config_result.value
+        config["test_timestamp"] = datetime.now().isoformat()
+
+        # Save config
+        save_result = self.config_repo.save_config(config)
+        if save_result.is_failure:
+            return {"success": False, "error": str(save_result.error)}
+
+        return {"success": True}
+
+
+class StressLoadConfigWorker(Worker[Dict[str, Any]]):
+    """Worker that performs one staggered config load for the stress test."""
+
+    def __init__(self, config_repo: IConfigRepository, index: int):
+        """Initialize the stress load config worker."""
+        super().__init__()
+        self.config_repo = config_repo
+        self.index = index
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        # Add a small delay to create more concurrency
+        time.sleep(0.05 * (self.index % 10))
+        config_result = self.config_repo.load_config(force_reload=True)
+        if config_result.is_failure:
+            return {"success": False, "error": str(config_result.error), "index": self.index}
+        return {"success": True, "index": self.index}
+
+
+class StressSaveConfigWorker(Worker[Dict[str, Any]]):
+    """Worker that performs one staggered config save for the stress test."""
+
+    def __init__(self, config_repo: IConfigRepository, index: int):
+        """Initialize the stress save config worker."""
+        super().__init__()
+        self.config_repo = config_repo
+        self.index = index
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        # Add a small delay to create more concurrency
+        time.sleep(0.05 * (self.index % 10))
+
+        # Get current config
+        config_result = self.config_repo.load_config()
+        if config_result.is_failure:
+            return {"success": False, "error": str(config_result.error), "index": self.index}
+
+        # Update a value
+        config = config_result.value
+        config[f"stress_test_{self.index}"] = datetime.now().isoformat()
+
+        # Save config
+        save_result = self.config_repo.save_config(config)
+        if save_result.is_failure:
+            return {"success": False, "error": str(save_result.error), "index": self.index}
+
+        return {"success": True, "index": self.index}
+
+
+class ScreenshotWorker(Worker[Dict[str, Any]]):
+    """Worker that captures a region and encodes a preview of it."""
+
+    def __init__(self, screenshot_service: IScreenshotService, region):
+        """Initialize the screenshot worker."""
+        super().__init__()
+        self.screenshot_service = screenshot_service
+        self.region = region
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        capture_result = self.screenshot_service.capture_region(self.region)
+        if capture_result.is_failure:
+            return {"success": False, "error": str(capture_result.error)}
+
+        # Downscale for display here so the UI thread only decodes a small preview
+        image = capture_result.value
+        preview = image
+        if image.width > _PREVIEW_MAX_SIZE[0] or image.height > _PREVIEW_MAX_SIZE[1]:
+            preview = image.copy()
+            preview.thumbnail(_PREVIEW_MAX_SIZE)
+
+        # Convert to bytes for transport across thread boundary
+        bytes_result = self.screenshot_service.to_bytes(preview)
+        if bytes_result.is_failure:
+            return {"success": False, "error": str(bytes_result.error)}
+
+        return {
+            "success": True,
+            "image_bytes": bytes_result.value,
+            "size": (image.width, image.height)
+        }
+
+
+class MultiScreenshotWorker(Worker[Dict[str, Any]]):
+    """Worker that performs one staggered capture for the multi-capture test."""
+
+    def __init__(self, screenshot_service: IScreenshotService, region, index: int):
+        """Initialize the multi-capture screenshot worker."""
+        super().__init__()
+        self.screenshot_service = screenshot_service
+        self.region = region
+        self.index = index
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        # Add a small delay to create more concurrency
+        time.sleep(0.05 * (self.index % 5))
+
+        capture_result = self.screenshot_service.capture_region(self.region)
+        if capture_result.is_failure:
+            return {"success": False, "error": str(capture_result.error), "index": self.index}
+
+        # Get image dimensions
+        image = capture_result.value
+
+        return {"success": True, "size": (image.width, image.height), "index": self.index}
+
+
+class OcrWorker(Worker[Dict[str, Any]]):
+    """Worker that captures a region and extracts its text and numeric values."""
+
+    def __init__(self, screenshot_service: IScreenshotService, ocr_service: IOcrService, region):
+        """Initialize the OCR worker."""
+        super().__init__()
+        self.screenshot_service = screenshot_service
+        self.ocr_service = ocr_service
+        self.region = region
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        # Capture screenshot
+        capture_result = self.screenshot_service.capture_region(self.region)
+        if capture_result.is_failure:
+            return {"success": False, "error": str(capture_result.error), "stage": "screenshot"}
+
+        image = capture_result.value
+
+        # Extract text
+        ocr_result = self.ocr_service.extract_text(image)
+        if ocr_result.is_failure:
+            return {"success": False, "error": str(ocr_result.error), "stage": "ocr"}
+
+        text = ocr_result.value
+
+        # Extract numeric values
+        numeric_result = self.ocr_service.extract_numeric_values(text)
+        if numeric_result.is_failure:
+            return {"success": False, "error": str(numeric_result.error), "stage": "numeric"}
+
+        values = numeric_result.value
+
+        # Return all results
+        return {
+            "success": True,
+            "text": text,
+            "values": values
+        }
+
+
+class MultiOcrWorker(Worker[Dict[str, Any]]):
+    """Worker that performs one capture and OCR pass for the multi-OCR test."""
+
+    def __init__(self, screenshot_service: IScreenshotService, ocr_service: IOcrService, region, index: int):
+        """Initialize the multi-OCR worker."""
+        super().__init__()
+        self.screenshot_service = screenshot_service
+        self.ocr_service = ocr_service
+        self.region = region
+        self.index = index
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        # Capture screenshot
+        capture_result = self.screenshot_service.capture_region(self.region)
+        if capture_result.is_failure:
+            return {"success": False, "error": str(capture_result.error), "index": self.index}
+
+        image = capture_result.value
+
+        # Extract text
+        ocr_result = self.ocr_service.extract_text(image)
+        if ocr_result.is_failure:
+            return {"success": False, "error": str(ocr_result.error), "index": self.index}
+
+        text = ocr_result.value
+
+        # Extract numeric values
+        numeric_result = self.ocr_service.extract_numeric_values(text)
+        if numeric_result.is_failure:
+            return {"success": False, "error": str(numeric_result.error), "index": self.index}
+
+        values = numeric_result.value
+
+        # Return results
+        return {
+            "success": True,
+            "text_length": len(text),
+            "values_count": len(values),
+            "index": self.index
+        }
+
+
+class LockoutWorker(Worker[Dict[str, Any]]):
+    """Worker that performs a platform lockout and forwards its status updates."""
+
+    def __init__(self, lockout_service: ILockoutService, platform: str, flatten_positions, duration: int):
+        """Initialize the lockout worker."""
+        super().__init__()
+        self.lockout_service = lockout_service
+        self.platform = platform
+        self.flatten_positions = flatten_positions
+        self.duration = duration
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        result = self.lockout_service.perform_lockout(
+            platform=self.platform,
+            flatten_positions=self.flatten_positions,
+            lockout_duration=self.duration,
+            on_status_update=self.on_status_update
+        )
+
+        if result.is_failure:
+            return {"success": False, "error": str(result.error)}
+
+        return {"success": True}
+
+    def on_status_update(self, message, level):
+        """Forward a lockout status update to the UI thread."""
+        # We need to use a signal to safely update UI from worker thread
+        self.report_progress(50, f"{level}:{message}")
+
+
+class VerifyBlockWorker(Worker[Dict[str, Any]]):
+    """Worker that verifies a block and records it as verified on success."""
+
+    def __init__(self, verification_service: IVerificationService, platform: str, block_name: str):
+        """Initialize the verify block worker."""
+        super().__init__()
+        self.verification_service = verification_service
+        self.platform = platform
+        self.block_name = block_name
+        self.stop_event = threading.Event()
+
+    def execute(self) -> Dict[str, Any]:
+        """Execute the worker task."""
+        result = self.verification_service.verify_block(
+            platform=self.platform,
+            block_name=self.block_name,
+            cancellable=True
+        )
+
+        if result.is_failure:
+            return {"success": False, "error": str(result.error)}
+
+        # If successful, add to verified blocks
+        if result.value:
+            add_result = self.verification_service.add_verified_block(
+                platform=self.platform,
+                block_name=self.block_name
+            )
+
+            if add_result.is_failure:
+                return {
+                    "success": True,
+                    "verified": True,
+                    "added": False,
+                    "error": str(add_result.error)
+                }
+
+            return {"success": True, "verified": True, "added": True}
+        else:
+            return {"success": True, "verified": False}
+
+    def cancel(self):
+        """Cancel the verification process."""
+        self.stop_event.set()
+        super().cancel()
+
+
+class LoadVerifiedBlocksWorker(Worker[List[Dict[str, Any]]]):
+    """Worker that reads the verified blocks list."""
+
+    def __init__(self, verification_service: IVerificationService):
+        """Initialize the load verified blocks worker."""
+        super().__init__()
+        self.verification_service = verification_service
+
+    def execute(self) -> Result[List[Dict[str, Any]]]:
+        """Execute the worker task."""
+        return self.verification_service.get_verified_blocks()
+
+
 class ThreadingTestApp(QMainWindow):
     """Main window for the Threading Test Application."""
 
@@ -97,22 +664,72 @@ class ThreadingTestApp(QMainWindow):
 
         # Initialize application
         self.container = initialize_app()
-        self.logger = self.container.resolve(ILoggerService)
-        self.thread_service = self.container.resolve(IBackgroundTaskService)
-        self.config_repository = self.container.resolve(IConfigRepository)
-        self.platform_detection_service = self.container.resolve(IPlatformDetectionService)
-        self.screenshot_service = self.container.resolve(IScreenshotService)
-        self.ocr_service = self.container.resolve(IOcrService)
-        self.monitoring_service = self.container.resolve(IMonitoringService)
-        self.lockout_service = self.container.resolve(ILockoutService)
-        self.verification_service = self.container.resolve(IVerificationService)
-        self.window_manager = self.container.resolve(IWindowManager)
+        (self.logger,
+         self.thread_service,
+         self.config_repository,
+         self.platform_detection_service,
+         self.screenshot_service,
+         self.ocr_service,
+         self.monitoring_service,
+         self.lockout_service,
+         self.verification_service,
+         self.window_manager) = self.container.resolve_many((
+            ILoggerService,
+            IBackgroundTaskService,
+            IConfigRepository,
+            IPlatformDetectionService,
+            IScreenshotService,
+            IOcrService,
+            IMonitoringService,
+            ILockoutService,
+            IVerificationService,
+            IWindowManager,
+        ))
+
+        # Timestamp cache for log_message, refreshed when the wall-clock second changes
+        self._timestamp_second = None
+        self._timestamp = ""
+
+        # (platform, block_name) pairs known to be verified; rebuilt by refresh_verified_blocks
+        self._verified_set = set()
+        self._verified_signature = None
+        self._verified_refresh_pending = False
+        # Set when a refresh is requested while a load is in flight; that load may
+        # predate the change, so another one runs once it finishes
+        self._verified_reload_requested = False
+
+        # Regions chosen on the screenshot, OCR and monitoring tabs; the stress tab
+        # falls back to the full screen while they are unset
+        self.selected_region = None
+        self.ocr_region = None
+        self.monitoring_region = None
+
+        # Monitoring status lines waiting to be written by _flush_monitoring_status
+        self._monitoring_status_buffer = []
+        self._monitoring_status_timer = QTimer(self)
+        self._monitoring_status_timer.setSingleShot(True)
+        self._monitoring_status_timer.setInterval(16)
+        self._monitoring_status_timer.timeout.connect(self._flush_monitoring_status)
+
+        # Lines queued per log widget by _queue_log_line, written together on the next tick
+        self._pending_log_lines = {}
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(30)
+        self._log_flush_timer.timeout.connect(self._flush_pending_log_lines)
+
+        # Supported platform names, looked up once and shared by every platform combo
+        platforms_result = self.platform_detection_service.get_supported_platforms()
+        self._supported_platforms = tuple(platforms_result.value) if platforms_result.is_success else ()
 
         # Set up UI
         self.setWindowTitle("MonitorPal Threading Test")
         self.resize(1000, 800)
         self.signals = TestSignals()
         self.signals.log_message.connect(self.log_message)
+        self.signals.monitoring_status.connect(self.on_monitoring_status_update, Qt.QueuedConnection)
+        self.signals.monitoring_threshold_exceeded.connect(self.on_monitoring_threshold_exceeded, Qt.QueuedConnection)
+        self.signals.monitoring_error.connect(self.on_monitoring_error, Qt.QueuedConnection)
 
         # Central widget and main layout
         central_widget = QWidget()
@@ -122,21 +739,26 @@ class ThreadingTestApp(QMainWindow):
         self.tab_widget = QTabWidget()
         main_layout.addWidget(self.tab_widget)
 
-        # Create tabs for different tests
-        self.create_thread_service_tab()
-        self.create_config_repository_tab()
-        self.create_screenshot_tab()
-        self.create_ocr_tab()
-        self.create_monitoring_tab()
-        self.create_lockout_tab()
-        self.create_verification_tab()
-        self.create_stress_test_tab()
+        # Create tabs for different tests. Only the first tab is built up front;
+        # the others get a placeholder and are built the first time they are shown.
+        self.tab_widget.addTab(self.create_thread_service_tab(), "Thread Service")
+        self._lazy_tabs = {}
+        for title, builder in (
+            ("Config Repository", self.create_config_repository_tab),
+            ("Screenshot Service", self.create_screenshot_tab),
+            ("OCR Service", self.create_ocr_tab),
+            ("Monitoring Service", self.create_monitoring_tab),
+            ("Lockout Service", self.create_lockout_tab),
+            ("Verification Service", self.create_verification_tab),
+            ("Stress Test", self.create_stress_test_tab),
+        ):
+            self._lazy_tabs[self.tab_widget.addTab(QWidget(), title)] = builder
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         # Global log and status bar
         log_group = QGroupBox("Global Log")
         log_layout = QVBoxLayout(log_group)
-        self.global_log = QTextEdit()
-        self.global_log.setReadOnly(True)
+        self.global_log = self._log_view()
         log_layout.addWidget(self.global_log)
         main_layout.addWidget(log_group)
 
@@ -155,18 +777,83 @@ class ThreadingTestApp(QMainWindow):
         # Accept the event to close the window
         event.accept()
 
+    def _on_tab_changed(self, index):
+        """Build a deferred tab the first time it is shown."""
+        builder = self._lazy_tabs.pop(index, None)
+        if builder is None:
+            return
+
+        title = self.tab_widget.tabText(index)
+        placeholder = self.tab_widget.widget(index)
+
+        # Swap the placeholder for the real tab without re-entering this handler
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, builder(), title)
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
     def log_message(self, message, level="INFO"):
         """Log a message to the global log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        if level == "INFO":
-            self.global_log.append(f"[{timestamp}] {message}")
-        elif level == "WARNING":
-            self.global_log.append(f"[{timestamp}] <span style='color:orange'>{message}</span>")
-        elif level == "ERROR":
-            self.global_log.append(f"[{timestamp}] <span style='color:red'>{message}</span>")
-        elif level == "SUCCESS":
-            self.global_log.append(f"[{timestamp}] <span style='color:green'>{message}</span>")
+        # Format the timestamp at most once per second; bursts share the cached string
+        now = int(time.time())
+        if now != self._timestamp_second:
+            self._timestamp_second = now
+            self._timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+        timestamp = self._timestamp
+
+        line = _format_log_line(message, level)
+        if line is not None:
+            self._queue_log_line(self.global_log, f"[{timestamp}] {line}")
+
+    def _queue_log_line(self, text_edit, line):
+        """Queue a line for a log widget; bursts are written in one edit block."""
+        self._pending_log_lines.setdefault(text_edit, []).append(line)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_pending_log_lines(self):
+        """Write all queued log lines, one batch per widget."""
+        pending, self._pending_log_lines = self._pending_log_lines, {}
+        for text_edit, lines in pending.items():
+            self.append_lines(text_edit, lines)
+
+    @staticmethod
+    def _log_view():
+        """Create a read-only log QTextEdit capped at _LOG_MAX_BLOCKS lines."""
+        text_edit = QTextEdit()
+        text_edit.setReadOnly(True)
+        text_edit.document().setMaximumBlockCount(_LOG_MAX_BLOCKS)
+        return text_edit
+
+    @staticmethod
+    def _spin(low, high, value):
+        """Create a QSpinBox with the given range and initial value."""
+        spinner = QSpinBox()
+        spinner.setRange(low, high)
+        spinner.setValue(value)
+        return spinner
+
+    def append_lines(self, text_edit, lines):
+        """Append several lines to a log inside one edit block so it is laid out once."""
+        # Only follow the output if the user has not scrolled up to read history
+        scroll_bar = text_edit.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 4
+
+        cursor = text_edit.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for line in lines:
+            if not cursor.atStart():
+                cursor.insertBlock()
+            cursor.insertHtml(line)
+        cursor.endEditBlock()
+
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
 
     # ----------------------------------------------------------------------------
     # Thread Service Tab Methods
@@ -184,18 +871,14 @@ class ThreadingTestApp(QMainWindow):
         # Number of tasks
         task_layout = QHBoxLayout()
         task_layout.addWidget(QLabel("Number of Tasks:"))
-        self.task_count_spinner = QSpinBox()
-        self.task_count_spinner.setRange(1, 100)
-        self.task_count_spinner.setValue(5)
+        self.task_count_spinner = self._spin(1, 100, 5)
         task_layout.addWidget(self.task_count_spinner)
         controls_layout.addLayout(task_layout)
 
         # Task duration
         duration_layout = QHBoxLayout()
         duration_layout.addWidget(QLabel("Task Duration (seconds):"))
-        self.task_duration_spinner = QSpinBox()
-        self.task_duration_spinner.setRange(1, 30)
-        self.task_duration_spinner.setValue(3)
+        self.task_duration_spinner = self._spin(1, 30, 3)
         duration_layout.addWidget(self.task_duration_spinner)
         controls_layout.addLayout(duration_layout)
 
@@ -215,13 +898,11 @@ class ThreadingTestApp(QMainWindow):
         # Log
         log_group = QGroupBox("Thread Service Log")
         log_layout = QVBoxLayout(log_group)
-        self.thread_log = QTextEdit()
-        self.thread_log.setReadOnly(True)
+        self.thread_log = self._log_view()
         log_layout.addWidget(self.thread_log)
         layout.addWidget(log_group)
 
-        # Add tab
-        self.tab_widget.addTab(tab, "Thread Service")
+        return tab
 
     def start_thread_tasks(self):
         """Start multiple thread tasks to test the thread service."""
@@ -230,6 +911,8 @@ class ThreadingTestApp(QMainWindow):
 
         self.thread_log.append(f"Starting {count} tasks with {duration} second duration...")
 
+        # Collect per-task lines and add them to the log in one batch
+        lines = []
         for i in range(count):
             task_id = f"test_task_{i}"
             worker = SleepWorker(duration, f"Task {i}")
@@ -244,9 +927,11 @@ class ThreadingTestApp(QMainWindow):
             result = self.thread_service.execute_task(task_id, worker)
 
             if result.is_failure:
-                self.thread_log.append(f"<span style='color:red'>Failed to start task {i}: {result.error}</span>")
+                lines.append(f"<span style='color:red'>Failed to start task {i}: {result.error}</span>")
             else:
-                self.thread_log.append(f"Task {i} started successfully")
+                lines.append(f"Task {i} started successfully")
+
+        self.append_lines(self.thread_log, lines)
 
         # Update running tasks
         self.update_running_tasks()
@@ -261,15 +946,17 @@ class ThreadingTestApp(QMainWindow):
 
         self.thread_log.append(f"Cancelling {len(tasks)} tasks...")
 
+        lines = []
         for task_id in tasks:
             # Cancel all tasks, not just test_task_ ones
             result = self.thread_service.cancel_task(task_id)
 
             if result.is_failure:
-                self.thread_log.append(
-                    f"<span style='color:red'>Failed to cancel task {task_id}: {result.error}</span>")
+                lines.append(f"<span style='color:red'>Failed to cancel task {task_id}: {result.error}</span>")
             else:
-                self.thread_log.append(f"Task {task_id} cancelled successfully")
+                lines.append(f"Task {task_id} cancelled successfully")
+
+        self.append_lines(self.thread_log, lines)
 
         # Update running tasks
         self.update_running_tasks()
@@ -331,28 +1018,18 @@ class ThreadingTestApp(QMainWindow):
         # Log
         log_group = QGroupBox("Config Repository Log")
         log_layout = QVBoxLayout(log_group)
-        self.config_log = QTextEdit()
-        self.config_log.setReadOnly(True)
+        self.config_log = self._log_view()
         log_layout.addWidget(self.config_log)
         layout.addWidget(log_group)
 
-        # Add tab
-        self.tab_widget.addTab(tab, "Config Repository")
+        return tab
 
     def test_load_config(self):
         """Test loading the configuration."""
         self.config_log.append("Loading configuration...")
 
         # Create a worker for the load operation
-        class LoadConfigWorker(Worker):
-            def execute(self):
-                config_result = self.config_repo.load_config(force_reload=True)
-                if config_result.is_failure:
-                    return {"success": False, "error": str(config_result.error)}
-                return {"success": True, "config": config_result.value}
-
-        worker = LoadConfigWorker()
-        worker.config_repo = self.config_repository
+        worker = LoadConfigWorker(self.config_repository)
 
         # Set callbacks
         worker.set_on_completed(self.on_config_loaded)
@@ -388,26 +1065,7 @@ class ThreadingTestApp(QMainWindow):
         self.config_log.append("Saving configuration...")
 
         # Create a worker for the save operation
-        class SaveConfigWorker(Worker):
-            def execute(self):
-                # Get current config
-                config_result = self.config_repo.load_config()
-                if config_result.is_failure:
-                    return {"success": False, "error": str(config_result.error)}
-
-                # Update a value to ensure a change
-                config = config_result.value
-                config["test_timestamp"] = datetime.now().isoformat()
-
-                # Save config
-                save_result = self.config_repo.save_config(config)
-                if save_result.is_failure:
-                    return {"success": False, "error": str(save_result.error)}
-
-                return {"success": True}
-
-        worker = SaveConfigWorker()
-        worker.config_repo = self.config_repository
+        worker = SaveConfigWorker(self.config_repository)
 
         # Set callbacks
         worker.set_on_completed(self.on_config_saved)
@@ -449,18 +1107,7 @@ class ThreadingTestApp(QMainWindow):
 
     def _stress_load_config(self, index):
         """Execute a load config operation for stress testing."""
-
-        class StressLoadConfigWorker(Worker):
-            def execute(self):
-                # Add a small delay to create more concurrency
-                time.sleep(0.05 * (index % 10))
-                config_result = self.config_repo.load_config(force_reload=True)
-                if config_result.is_failure:
-                    return {"success": False, "error": str(config_result.error), "index": index}
-                return {"success": True, "index": index}
-
-        worker = StressLoadConfigWorker()
-        worker.config_repo = self.config_repository
+        worker = StressLoadConfigWorker(self.config_repository, index)
 
         # Set callbacks
         worker.set_on_completed(self.on_stress_config_completed)
@@ -477,30 +1124,7 @@ class ThreadingTestApp(QMainWindow):
 
     def _stress_save_config(self, index):
         """Execute a save config operation for stress testing."""
-
-        class StressSaveConfigWorker(Worker):
-            def execute(self):
-                # Add a small delay to create more concurrency
-                time.sleep(0.05 * (index % 10))
-
-                # Get current config
-                config_result = self.config_repo.load_config()
-                if config_result.is_failure:
-                    return {"success": False, "error": str(config_result.error), "index": index}
-
-                # Update a value
-                config = config_result.value
-                config[f"stress_test_{index}"] = datetime.now().isoformat()
-
-                # Save config
-                save_result = self.config_repo.save_config(config)
-                if save_result.is_failure:
-                    return {"success": False, "error": str(save_result.error), "index": index}
-
-                return {"success": True, "index": index}
-
-        worker = StressSaveConfigWorker()
-        worker.config_repo = self.config_repository
+        worker = StressSaveConfigWorker(self.config_repository, index)
 
         # Set callbacks
         worker.set_on_completed(self.on_stress_config_completed)
@@ -588,25 +1212,17 @@ class ThreadingTestApp(QMainWindow):
         # Log
         log_group = QGroupBox("Screenshot Log")
         log_layout = QVBoxLayout(log_group)
-        self.screenshot_log = QTextEdit()
-        self.screenshot_log.setReadOnly(True)
+        self.screenshot_log = self._log_view()
         log_layout.addWidget(self.screenshot_log)
         layout.addWidget(log_group)
 
-        # Add tab
-        self.tab_widget.addTab(tab, "Screenshot Service")
-
-        # Initialize state
-        self.selected_region = None
+        return tab
 
     def select_screenshot_region(self):
         """Select a region for screenshot capture."""
         self.screenshot_log.append("Opening region selection...")
 
         try:
-            # Import region selector directly
-            from src.presentation.components.qt_region_selector import select_region_qt
-
             # Use synchronous region selection directly
             region = select_region_qt(
                 "Please select the region to capture a screenshot."
@@ -620,7 +1236,6 @@ class ThreadingTestApp(QMainWindow):
                 self.screenshot_log.append("Region selection cancelled")
         except Exception as e:
             self.screenshot_log.append(f"<span style='color:red'>Error in region selection: {str(e)}</span>")
-            import traceback
             self.screenshot_log.append(traceback.format_exc())
 
     def test_screenshot_capture(self):
@@ -632,27 +1247,7 @@ class ThreadingTestApp(QMainWindow):
         self.screenshot_log.append(f"Capturing screenshot of region {self.selected_region}...")
 
         # Create a worker for the screenshot capture
-        class ScreenshotWorker(Worker):
-            def execute(self):
-                capture_result = self.screenshot_service.capture_region(self.region)
-                if capture_result.is_failure:
-                    return {"success": False, "error": str(capture_result.error)}
-
-                # Convert to bytes for transport across thread boundary
-                image = capture_result.value
-                bytes_result = self.screenshot_service.to_bytes(image)
-                if bytes_result.is_failure:
-                    return {"success": False, "error": str(bytes_result.error)}
-
-                return {
-                    "success": True,
-                    "image_bytes": bytes_result.value,
-                    "size": (image.width, image.height)
-                }
-
-        worker = ScreenshotWorker()
-        worker.screenshot_service = self.screenshot_service
-        worker.region = self.selected_region
+        worker = ScreenshotWorker(self.screenshot_service, self.selected_region)
 
         # Set callbacks
         worker.set_on_completed(self.on_screenshot_captured)
@@ -707,23 +1302,7 @@ class ThreadingTestApp(QMainWindow):
 
     def _execute_screenshot_capture(self, index):
         """Execute a screenshot capture for the multi-capture test."""
-        class MultiScreenshotWorker(Worker):
-            def execute(self):
-                # Add a small delay to create more concurrency
-                time.sleep(0.05 * (index % 5))
-
-                capture_result = self.screenshot_service.capture_region(self.region)
-                if capture_result.is_failure:
-                    return {"success": False, "error": str(capture_result.error), "index": index}
-
-                # Get image dimensions
-                image = capture_result.value
-
-                return {"success": True, "size": (image.width, image.height), "index": index}
-
-        worker = MultiScreenshotWorker()
-        worker.screenshot_service = self.screenshot_service
-        worker.region = self.selected_region
+        worker = MultiScreenshotWorker(self.screenshot_service, self.selected_region, index)
 
         # Set callbacks
         worker.set_on_completed(self.on_multi_screenshot_completed)
@@ -811,25 +1390,17 @@ class ThreadingTestApp(QMainWindow):
         # Log
         log_group = QGroupBox("OCR Log")
         log_layout = QVBoxLayout(log_group)
-        self.ocr_log = QTextEdit()
-        self.ocr_log.setReadOnly(True)
+        self.ocr_log = self._log_view()
         log_layout.addWidget(self.ocr_log)
         layout.addWidget(log_group)
 
-        # Add tab
-        self.tab_widget.addTab(tab, "OCR Service")
-
-        # Initialize state
-        self.ocr_region = None
+        return tab
 
     def select_ocr_region(self):
         """Select a region for OCR processing."""
         self.ocr_log.append("Opening region selection...")
 
         try:
-            # Import region selector directly - same approach as in select_screenshot_region
-            from src.presentation.components.qt_region_selector import select_region_qt
-
             # Use synchronous region selection directly
             region = select_region_qt(
                 "Please select the region for OCR processing."
@@ -843,7 +1414,6 @@ class ThreadingTestApp(QMainWindow):
                 self.ocr_log.append("Region selection cancelled")
         except Exception as e:
             self.ocr_log.append(f"<span style='color:red'>Error in region selection: {str(e)}</span>")
-            import traceback
             self.ocr_log.append(traceback.format_exc())
 
     def test_ocr(self):
@@ -855,40 +1425,7 @@ class ThreadingTestApp(QMainWindow):
         self.ocr_log.append(f"Performing OCR on region {self.ocr_region}...")
 
         # Create a worker for the OCR processing
-        class OcrWorker(Worker):
-            def execute(self):
-                # Capture screenshot
-                capture_result = self.screenshot_service.capture_region(self.region)
-                if capture_result.is_failure:
-                    return {"success": False, "error": str(capture_result.error), "stage": "screenshot"}
-
-                image = capture_result.value
-
-                # Extract text
-                ocr_result = self.ocr_service.extract_text(image)
-                if ocr_result.is_failure:
-                    return {"success": False, "error": str(ocr_result.error), "stage": "ocr"}
-
-                text = ocr_result.value
-
-                # Extract numeric values
-                numeric_result = self.ocr_service.extract_numeric_values(text)
-                if numeric_result.is_failure:
-                    return {"success": False, "error": str(numeric_result.error), "stage": "numeric"}
-
-                values = numeric_result.value
-
-                # Return all results
-                return {
-                    "success": True,
-                    "text": text,
-                    "values": values
-                }
-
-        worker = OcrWorker()
-        worker.screenshot_service = self.screenshot_service
-        worker.ocr_service = self.ocr_service
-        worker.region = self.ocr_region
+        worker = OcrWorker(self.screenshot_service, self.ocr_service, self.ocr_region)
 
         # Set callbacks
         worker.set_on_completed(self.on_ocr_completed)
@@ -909,15 +1446,13 @@ class ThreadingTestApp(QMainWindow):
             text = result["text"]
             values = result["values"]
 
-            self.ocr_results.clear()
-            self.ocr_results.append("<b>Extracted Text:</b>")
-            self.ocr_results.append(text)
-            self.ocr_results.append("\n<b>Numeric Values:</b>")
+            # Build the whole document and set it once instead of appending line by line
+            lines = ["<b>Extracted Text:</b>", html.escape(text).replace("\n", "<br>"), "<br><b>Numeric Values:</b>"]
             if values:
-                for i, value in enumerate(values):
-                    self.ocr_results.append(f"Value {i+1}: {value}")
+                lines.extend(f"Value {i+1}: {value}" for i, value in enumerate(values))
             else:
-                self.ocr_results.append("No numeric values detected")
+                lines.append("No numeric values detected")
+            self.ocr_results.setHtml("<br>".join(lines))
         else:
             stage = result.get("stage", "unknown")
             self.ocr_log.append(f"<span style='color:red'>OCR failed at {stage} stage: {result['error']}</span>")
@@ -944,41 +1479,7 @@ class ThreadingTestApp(QMainWindow):
 
     def _execute_ocr_operation(self, index):
         """Execute an OCR operation for the multi-OCR test."""
-        class MultiOcrWorker(Worker):
-            def execute(self):
-                # Capture screenshot
-                capture_result = self.screenshot_service.capture_region(self.region)
-                if capture_result.is_failure:
-                    return {"success": False, "error": str(capture_result.error), "index": index}
-
-                image = capture_result.value
-
-                # Extract text
-                ocr_result = self.ocr_service.extract_text(image)
-                if ocr_result.is_failure:
-                    return {"success": False, "error": str(ocr_result.error), "index": index}
-
-                text = ocr_result.value
-
-                # Extract numeric values
-                numeric_result = self.ocr_service.extract_numeric_values(text)
-                if numeric_result.is_failure:
-                    return {"success": False, "error": str(numeric_result.error), "index": index}
-
-                values = numeric_result.value
-
-                # Return results
-                return {
-                    "success": True,
-                    "text_length": len(text),
-                    "values_count": len(values),
-                    "index": index
-                }
-
-        worker = MultiOcrWorker()
-        worker.screenshot_service = self.screenshot_service
-        worker.ocr_service = self.ocr_service
-        worker.region = self.ocr_region
+        worker = MultiOcrWorker(self.screenshot_service, self.ocr_service, self.ocr_region, index)
 
         # Set callbacks
         worker.set_on_completed(self.on_multi_ocr_completed)
@@ -1036,11 +1537,7 @@ class ThreadingTestApp(QMainWindow):
         platform_layout.addWidget(QLabel("Platform:"))
         self.platform_combo = QComboBox()
 
-        # Get supported platforms
-        platforms_result = self.platform_detection_service.get_supported_platforms()
-        if platforms_result.is_success:
-            for platform in platforms_result.value.keys():
-                self.platform_combo.addItem(platform)
+        self.platform_combo.addItems(list(self._supported_platforms))
 
         platform_layout.addWidget(self.platform_combo)
         controls_layout.addLayout(platform_layout)
@@ -1058,18 +1555,14 @@ class ThreadingTestApp(QMainWindow):
         # Threshold
         threshold_layout = QHBoxLayout()
         threshold_layout.addWidget(QLabel("Threshold:"))
-        self.threshold_spinner = QSpinBox()
-        self.threshold_spinner.setRange(-10000, 0)
-        self.threshold_spinner.setValue(-100)
+        self.threshold_spinner = self._spin(-10000, 0, -100)
         threshold_layout.addWidget(self.threshold_spinner)
         controls_layout.addLayout(threshold_layout)
 
         # Interval
         interval_layout = QHBoxLayout()
         interval_layout.addWidget(QLabel("Interval (seconds):"))
-        self.interval_spinner = QSpinBox()
-        self.interval_spinner.setRange(1, 60)
-        self.interval_spinner.setValue(5)
+        self.interval_spinner = self._spin(1, 60, 5)
         interval_layout.addWidget(self.interval_spinner)
         controls_layout.addLayout(interval_layout)
 
@@ -1099,25 +1592,17 @@ class ThreadingTestApp(QMainWindow):
         # Log
         log_group = QGroupBox("Monitoring Log")
         log_layout = QVBoxLayout(log_group)
-        self.monitoring_log = QTextEdit()
-        self.monitoring_log.setReadOnly(True)
+        self.monitoring_log = self._log_view()
         log_layout.addWidget(self.monitoring_log)
         layout.addWidget(log_group)
 
-        # Add tab
-        self.tab_widget.addTab(tab, "Monitoring Service")
-
-        # Initialize state
-        self.monitoring_region = None
+        return tab
 
     def select_monitoring_region(self):
         """Select a region for monitoring."""
         self.monitoring_log.append("Opening region selection...")
 
         try:
-            # Import region selector directly
-            from src.presentation.components.qt_region_selector import select_region_qt
-
             # Use synchronous region selection directly
             region = select_region_qt(
                 "Please select the region to monitor."
@@ -1132,7 +1617,6 @@ class ThreadingTestApp(QMainWindow):
                 self.monitoring_log.append("Region selection cancelled")
         except Exception as e:
             self.monitoring_log.append(f"<span style='color:red'>Error in region selection: {str(e)}</span>")
-            import traceback
             self.monitoring_log.append(traceback.format_exc())
 
     def test_start_monitoring(self):
@@ -1154,9 +1638,9 @@ class ThreadingTestApp(QMainWindow):
             region=self.monitoring_region,
             threshold=threshold,
             interval_seconds=interval,
-            on_status_update=self.on_monitoring_status_update,
-            on_threshold_exceeded=self.on_monitoring_threshold_exceeded,
-            on_error=self.on_monitoring_error
+            on_status_update=self.signals.monitoring_status.emit,
+            on_threshold_exceeded=self.signals.monitoring_threshold_exceeded.emit,
+            on_error=self.signals.monitoring_error.emit
         )
 
         if result.is_success:
@@ -1188,14 +1672,19 @@ class ThreadingTestApp(QMainWindow):
 
     def on_monitoring_status_update(self, message, level):
         """Handle monitoring status update."""
-        if level == "INFO":
-            self.monitoring_log.append(message)
-        elif level == "WARNING":
-            self.monitoring_log.append(f"<span style='color:orange'>{message}</span>")
-        elif level == "ERROR":
-            self.monitoring_log.append(f"<span style='color:red'>{message}</span>")
-        elif level == "SUCCESS":
-            self.monitoring_log.append(f"<span style='color:green'>{message}</span>")
+        line = _format_log_line(message, level)
+        if line is not None:
+            self._monitoring_status_buffer.append(line)
+
+        # Status updates arrive in bursts per check; flush them once per frame
+        if not self._monitoring_status_timer.isActive():
+            self._monitoring_status_timer.start()
+
+    def _flush_monitoring_status(self):
+        """Write buffered monitoring status lines and refresh the latest values."""
+        if self._monitoring_status_buffer:
+            self.append_lines(self.monitoring_log, self._monitoring_status_buffer)
+            self._monitoring_status_buffer.clear()
 
         # Update latest result
         latest_result = self.monitoring_service.get_latest_result()
@@ -1208,6 +1697,10 @@ class ThreadingTestApp(QMainWindow):
 
     def on_monitoring_threshold_exceeded(self, result):
         """Handle monitoring threshold exceeded event."""
+        # Write any status lines still buffered so the alert lands after them
+        self._monitoring_status_timer.stop()
+        self._flush_monitoring_status()
+
         self.monitoring_log.append(f"<span style='color:red'>THRESHOLD EXCEEDED: {result.minimum_value:.2f} < {result.threshold:.2f}</span>")
         self.monitoring_status.setText("Threshold exceeded - monitoring stopped")
 
@@ -1217,6 +1710,8 @@ class ThreadingTestApp(QMainWindow):
 
     def on_monitoring_error(self, error):
         """Handle monitoring error event."""
+        self._monitoring_status_timer.stop()
+        self._flush_monitoring_status()
         self.monitoring_log.append(f"<span style='color:red'>Monitoring error: {error}</span>")
 
     # ----------------------------------------------------------------------------
@@ -1237,11 +1732,7 @@ class ThreadingTestApp(QMainWindow):
         platform_layout.addWidget(QLabel("Platform:"))
         self.lockout_platform_combo = QComboBox()
 
-        # Get supported platforms
-        platforms_result = self.platform_detection_service.get_supported_platforms()
-        if platforms_result.is_success:
-            for platform in platforms_result.value.keys():
-                self.lockout_platform_combo.addItem(platform)
+        self.lockout_platform_combo.addItems(list(self._supported_platforms))
 
         platform_layout.addWidget(self.lockout_platform_combo)
         controls_layout.addLayout(platform_layout)
@@ -1259,9 +1750,7 @@ class ThreadingTestApp(QMainWindow):
         # Duration
         duration_layout = QHBoxLayout()
         duration_layout.addWidget(QLabel("Lockout Duration (minutes):"))
-        self.lockout_duration_spinner = QSpinBox()
-        self.lockout_duration_spinner.setRange(1, 60)
-        self.lockout_duration_spinner.setValue(15)
+        self.lockout_duration_spinner = self._spin(1, 60, 15)
         duration_layout.addWidget(self.lockout_duration_spinner)
         controls_layout.addLayout(duration_layout)
 
@@ -1287,14 +1776,10 @@ class ThreadingTestApp(QMainWindow):
         # Log
         log_group = QGroupBox("Lockout Log")
         log_layout = QVBoxLayout(log_group)
-        self.lockout_log = QTextEdit()
-        self.lockout_log.setReadOnly(True)
+        self.lockout_log = self._log_view()
         log_layout.addWidget(self.lockout_log)
         layout.addWidget(log_group)
 
-        # Add tab
-        self.tab_widget.addTab(tab, "Lockout Service")
-
         # Initialize state
         self.flatten_positions = []
 
@@ -1303,14 +1788,13 @@ class ThreadingTestApp(QMainWindow):
         if ct_path:
             self.ct_path_label.setText(ct_path)
 
+        return tab
+
     def add_flatten_position(self):
         """Add a flatten position for the lockout test."""
         self.lockout_log.append("Opening region selection for flatten position...")
 
         try:
-            # Import region selector directly
-            from src.presentation.components.qt_region_selector import select_region_qt
-
             # Use synchronous region selection directly
             region = select_region_qt(
                 "Please select a region for the flatten position."
@@ -1330,7 +1814,6 @@ class ThreadingTestApp(QMainWindow):
                 self.lockout_log.append("Region selection cancelled")
         except Exception as e:
             self.lockout_log.append(f"<span style='color:red'>Error in region selection: {str(e)}</span>")
-            import traceback
             self.lockout_log.append(traceback.format_exc())
 
     def set_cold_turkey_path(self):
@@ -1365,29 +1848,7 @@ class ThreadingTestApp(QMainWindow):
             f"Performing lockout for {platform} with {len(self.flatten_positions)} flatten positions...")
 
         # Create a worker for the lockout
-        class LockoutWorker(Worker):
-            def execute(self):
-                result = self.lockout_service.perform_lockout(
-                    platform=self.platform,
-                    flatten_positions=self.flatten_positions,
-                    lockout_duration=self.duration,
-                    on_status_update=self.on_status_update
-                )
-
-                if result.is_failure:
-                    return {"success": False, "error": str(result.error)}
-
-                return {"success": True}
-
-            def on_status_update(self, message, level):
-                # We need to use a signal to safely update UI from worker thread
-                self.report_progress(50, f"{level}:{message}")
-
-        worker = LockoutWorker()
-        worker.lockout_service = self.lockout_service
-        worker.platform = platform
-        worker.flatten_positions = self.flatten_positions
-        worker.duration = duration
+        worker = LockoutWorker(self.lockout_service, platform, self.flatten_positions, duration)
 
         # Set callbacks
         worker.set_on_progress(self.on_lockout_progress)
@@ -1406,19 +1867,18 @@ class ThreadingTestApp(QMainWindow):
          if ":" in message:
             level, msg = message.split(":", 1)
 
-            if level == "INFO":
-                self.lockout_log.append(msg)
-            elif level == "WARNING":
-                self.lockout_log.append(f"<span style='color:orange'>{msg}</span>")
-            elif level == "ERROR":
-                self.lockout_log.append(f"<span style='color:red'>{msg}</span>")
-            elif level == "SUCCESS":
-                self.lockout_log.append(f"<span style='color:green'>{msg}</span>")
+            line = _format_log_line(msg, level)
+            if line is not None:
+                self._queue_log_line(self.lockout_log, line)
          else:
-            self.lockout_log.append(message)
+            self._queue_log_line(self.lockout_log, message)
 
     def on_lockout_completed(self, result):
         """Handle lockout completed event."""
+        # Write queued progress lines first so the outcome follows them
+        self._log_flush_timer.stop()
+        self._flush_pending_log_lines()
+
         if result["success"]:
             self.lockout_log.append("<span style='color:green'>Lockout completed successfully</span>")
         else:
@@ -1442,11 +1902,7 @@ class ThreadingTestApp(QMainWindow):
         platform_layout.addWidget(QLabel("Platform:"))
         self.verify_platform_combo = QComboBox()
 
-        # Get supported platforms
-        platforms_result = self.platform_detection_service.get_supported_platforms()
-        if platforms_result.is_success:
-            for platform in platforms_result.value.keys():
-                self.verify_platform_combo.addItem(platform)
+        self.verify_platform_combo.addItems(list(self._supported_platforms))
 
         platform_layout.addWidget(self.verify_platform_combo)
         controls_layout.addLayout(platform_layout)
@@ -1497,70 +1953,31 @@ class ThreadingTestApp(QMainWindow):
         # Log
         log_group = QGroupBox("Verification Log")
         log_layout = QVBoxLayout(log_group)
-        self.verification_log = QTextEdit()
-        self.verification_log.setReadOnly(True)
+        self.verification_log = self._log_view()
         log_layout.addWidget(self.verification_log)
         layout.addWidget(log_group)
 
-        # Add tab
-        self.tab_widget.addTab(tab, "Verification Service")
-
         # Initialize verified blocks
         self.refresh_verified_blocks()
 
+        return tab
+
     def test_verify_block(self):
         """Test verifying a Cold Turkey block."""
         # Get parameters
         platform = self.verify_platform_combo.currentText()
         block_name = self.block_name_combo.currentText()
 
+        # Skip the verification round-trip if this block is already verified
+        if (platform, block_name) in self._verified_set:
+            self.verification_log.append(
+                f"<span style='color:green'>Block '{block_name}' already verified for platform '{platform}'</span>")
+            return
+
         self.verification_log.append(f"Verifying block '{block_name}' for platform '{platform}'...")
 
         # Create a worker for the verification
-        class VerifyBlockWorker(Worker):
-            def execute(self):
-                # Create an event for cancellation
-                import threading
-                self.stop_event = threading.Event()
-
-                result = self.verification_service.verify_block(
-                    platform=self.platform,
-                    block_name=self.block_name,
-                    cancellable=True
-                )
-
-                if result.is_failure:
-                    return {"success": False, "error": str(result.error)}
-
-                # If successful, add to verified blocks
-                if result.value:
-                    add_result = self.verification_service.add_verified_block(
-                        platform=self.platform,
-                        block_name=self.block_name
-                    )
-
-                    if add_result.is_failure:
-                        return {
-                            "success": True,
-                            "verified": True,
-                            "added": False,
-                            "error": str(add_result.error)
-                        }
-
-                    return {"success": True, "verified": True, "added": True}
-                else:
-                    return {"success": True, "verified": False}
-
-            def cancel(self):
-                """Cancel the verification process."""
-                if hasattr(self, 'stop_event'):
-                    self.stop_event.set()
-                super().cancel()
-
-        worker = VerifyBlockWorker()
-        worker.verification_service = self.verification_service
-        worker.platform = platform
-        worker.block_name = block_name
+        worker = VerifyBlockWorker(self.verification_service, platform, block_name)
 
         # Set callbacks
         worker.set_on_completed(self.on_verification_completed)
@@ -1607,7 +2024,7 @@ class ThreadingTestApp(QMainWindow):
                     self.verification_log.append(f"<span style='color:orange'>Block verified but not added: {error}</span>")
 
                 # Refresh verified blocks
-                self.refresh_verified_blocks()
+                self._schedule_verified_refresh()
             else:
                 self.verification_log.append("<span style='color:orange'>Block verification failed</span>")
         else:
@@ -1617,26 +2034,80 @@ class ThreadingTestApp(QMainWindow):
         self.verify_button.setEnabled(True)
         self.cancel_verify_button.setEnabled(False)
 
+    def _schedule_verified_refresh(self):
+        """Queue one refresh of the verified blocks list.
+
+        Mutations that land in the same event-loop turn share a single refresh
+        instead of re-querying the verification service once each.
+        """
+        if self._verified_refresh_pending:
+            return
+        self._verified_refresh_pending = True
+        QTimer.singleShot(0, self._run_verified_refresh)
+
+    def _run_verified_refresh(self):
+        """Run a refresh queued by _schedule_verified_refresh."""
+        self._verified_refresh_pending = False
+        self.refresh_verified_blocks()
+
     def refresh_verified_blocks(self):
         """Refresh the list of verified blocks."""
+        # A load already in flight may have read the blocks before this change;
+        # run another one when it finishes
+        if self.thread_service.is_task_running("load_verified_blocks"):
+            self._verified_reload_requested = True
+            return
+
         self.verification_log.append("Refreshing verified blocks...")
 
-        # Get verified blocks
-        result = self.verification_service.get_verified_blocks()
+        # Read the blocks in the background; only the display update runs on the UI thread
+        worker = LoadVerifiedBlocksWorker(self.verification_service)
+
+        # Set callbacks
+        worker.set_on_completed(self.on_verified_blocks_loaded)
+        worker.set_on_error(self.on_verified_blocks_error)
+
+        # Execute in background
+        result = self.thread_service.execute_task_with_auto_cleanup("load_verified_blocks", worker)
+
+        if result.is_failure:
+            self.verification_log.append(f"<span style='color:red'>Failed to get verified blocks: {result.error}</span>")
+
+    def _rerun_requested_verified_refresh(self):
+        """Queue the refresh requested while the last load was in flight, if any."""
+        if self._verified_reload_requested:
+            self._verified_reload_requested = False
+            # Deferred, as the finished load is only cleaned up after this callback returns
+            self._schedule_verified_refresh()
+
+    def on_verified_blocks_error(self, error):
+        """Handle an unexpected failure while loading verified blocks."""
+        self.verification_log.append(f"<span style='color:red'>Error loading verified blocks: {error}</span>")
+        self._rerun_requested_verified_refresh()
+
+    def on_verified_blocks_loaded(self, result):
+        """Handle verified blocks loaded event."""
+        self._rerun_requested_verified_refresh()
 
         if result.is_success:
             blocks = result.value
+            signature = tuple((block.get("platform"), block.get("block_name")) for block in blocks)
 
-            # Display blocks
-            self.verified_blocks_text.clear()
+            # Leave the view alone when the list is unchanged since the last load
+            if signature == self._verified_signature:
+                self.verification_log.append(f"Verified blocks unchanged ({len(blocks)})")
+                return
+            self._verified_signature = signature
+            self._verified_set = set(signature)
 
+            # Display blocks
             if blocks:
-                for block in blocks:
-                    platform = block.get("platform", "Unknown")
-                    block_name = block.get("block_name", "Unknown")
-                    self.verified_blocks_text.append(f"Platform: {platform}, Block: {block_name}")
+                self.verified_blocks_text.setPlainText("\n".join(
+                    f"Platform: {block.get('platform', 'Unknown')}, Block: {block.get('block_name', 'Unknown')}"
+                    for block in blocks
+                ))
             else:
-                self.verified_blocks_text.append("No verified blocks found")
+                self.verified_blocks_text.setPlainText("No verified blocks found")
 
             self.verification_log.append(f"<span style='color:green'>Found {len(blocks)} verified blocks</span>")
         else:
@@ -1652,8 +2123,12 @@ class ThreadingTestApp(QMainWindow):
         if result.is_success:
             self.verification_log.append("<span style='color:green'>All verified blocks cleared</span>")
 
+            # Nothing is verified any more; don't let a skip check see the old set
+            # before the refresh below lands
+            self._verified_set.clear()
+
             # Refresh display
-            self.refresh_verified_blocks()
+            self._schedule_verified_refresh()
         else:
             self.verification_log.append(f"<span style='color:red'>Failed to clear verified blocks: {result.error}</span>")
 
@@ -1673,18 +2148,14 @@ class ThreadingTestApp(QMainWindow):
         # Number of threads
         threads_layout = QHBoxLayout()
         threads_layout.addWidget(QLabel("Number of Threads:"))
-        self.stress_threads_spinner = QSpinBox()
-        self.stress_threads_spinner.setRange(1, 50)
-        self.stress_threads_spinner.setValue(10)
+        self.stress_threads_spinner = self._spin(1, 50, 10)
         threads_layout.addWidget(self.stress_threads_spinner)
         controls_layout.addLayout(threads_layout)
 
         # Duration
         duration_layout = QHBoxLayout()
         duration_layout.addWidget(QLabel("Test Duration (seconds):"))
-        self.stress_duration_spinner = QSpinBox()
-        self.stress_duration_spinner.setRange(5, 300)
-        self.stress_duration_spinner.setValue(30)
+        self.stress_duration_spinner = self._spin(5, 300, 30)
         duration_layout.addWidget(self.stress_duration_spinner)
         controls_layout.addLayout(duration_layout)
 
@@ -1735,9 +2206,6 @@ class ThreadingTestApp(QMainWindow):
         stats_layout.addWidget(self.stress_stats_text)
         layout.addWidget(stats_group)
 
-        # Add tab
-        self.tab_widget.addTab(tab, "Stress Test")
-
         # Initialize state
         self.stress_test_running = False
         self.stress_test_timer = QTimer()
@@ -1745,6 +2213,8 @@ class ThreadingTestApp(QMainWindow):
         self.stress_start_time = 0
         self.stress_tasks = []
 
+        return tab
+
     def start_stress_test(self):
         """Start a stress test of the selected component."""
         # Get parameters
@@ -1810,10 +2280,12 @@ class ThreadingTestApp(QMainWindow):
 
         # Final report
         elapsed = time.time() - self.stress_start_time
-        self.stress_stats_text.append(f"Stress test completed after {elapsed:.1f} seconds")
-        self.stress_stats_text.append(f"Completed tasks: {self.stress_completed_tasks}")
-        self.stress_stats_text.append(f"Successful tasks: {self.stress_successful_tasks}")
-        self.stress_stats_text.append(f"Failed tasks: {self.stress_failed_tasks}")
+        self.append_lines(self.stress_stats_text, [
+            f"Stress test completed after {elapsed:.1f} seconds",
+            f"Completed tasks: {self.stress_completed_tasks}",
+            f"Successful tasks: {self.stress_successful_tasks}",
+            f"Failed tasks: {self.stress_failed_tasks}",
+        ])
 
     def update_stress_progress(self):
         """Update the stress test progress."""
@@ -1852,38 +2324,6 @@ class ThreadingTestApp(QMainWindow):
     def _launch_thread_service_task(self, index):
         """Launch a thread service stress test task."""
         # Create worker that does multiple iterations
-        class ThreadStressWorker(Worker):
-            def execute(self):
-                results = []
-
-                # Run until cancelled or the stress test completes
-                while not self.cancel_requested:
-                    try:
-                        # Random sleep duration
-                        import random
-                        duration = random.uniform(0.1, 1.0)
-
-                        # Sleep
-                        time.sleep(duration)
-
-                        # Report progress
-                        self.report_progress(50, f"Iteration completed with duration {duration:.2f}")
-
-                        # Add to results
-                        results.append(duration)
-
-                        # Occasionally report error to test error handling
-                        if random.random() < 0.05:  # 5% chance
-                            self.report_error(f"Random error in iteration {len(results)}")
-                    except Exception as e:
-                        self.report_error(f"Exception in thread stress task: {e}")
-
-                return {
-                    "iterations": len(results),
-                    "total_duration": sum(results),
-                    "avg_duration": sum(results) / len(results) if results else 0
-                }
-
         worker = ThreadStressWorker()
 
         # Set callbacks
@@ -1911,49 +2351,7 @@ class ThreadingTestApp(QMainWindow):
     def _launch_config_repo_task(self, index):
         """Launch a config repository stress test task."""
         # Create worker that alternates between load and save
-        class ConfigStressWorker(Worker):
-            def execute(self):
-                results = {"loads": 0, "saves": 0, "load_errors": 0, "save_errors": 0}
-
-                # Run until cancelled or the stress test completes
-                while not self.cancel_requested:
-                    try:
-                        # Alternate between load and save
-                        if results["loads"] <= results["saves"]:
-                            # Load config
-                            config_result = self.config_repo.load_config(force_reload=True)
-                            if config_result.is_failure:
-                                results["load_errors"] += 1
-                                self.report_error(f"Load error: {config_result.error}")
-                            else:
-                                results["loads"] += 1
-                        else:
-                            # Save config with a unique test value
-                            config_result = self.config_repo.load_config()
-                            if config_result.is_failure:
-                                results["load_errors"] += 1
-                                self.report_error(f"Load error before save: {config_result.error}")
-                            else:
-                                config = config_result.value
-                                config[f"stress_test_{index}_{results['saves']}"] = time.time()
-
-                                save_result = self.config_repo.save_config(config)
-                                if save_result.is_failure:
-                                    results["save_errors"] += 1
-                                    self.report_error(f"Save error: {save_result.error}")
-                                else:
-                                    results["saves"] += 1
-
-                        # Small delay to prevent too rapid operations
-                        time.sleep(0.1)
-
-                    except Exception as e:
-                        self.report_error(f"Exception in config stress task: {e}")
-
-                return results
-
-        worker = ConfigStressWorker()
-        worker.config_repo = self.config_repository
+        worker = ConfigStressWorker(self.config_repository, index)
 
         # Set callbacks
         worker.set_on_completed(self.on_stress_task_completed)
@@ -1973,7 +2371,7 @@ class ThreadingTestApp(QMainWindow):
         self.stress_stats_text.append("Screenshot Service stress test: Concurrent screenshot captures...")
 
         # Select entire screen as region if none selected
-        if not hasattr(self, 'selected_region') or not self.selected_region:
+        if not self.selected_region:
             # Use entire screen
             screen = QApplication.primaryScreen()
             rect = screen.geometry()
@@ -1987,51 +2385,7 @@ class ThreadingTestApp(QMainWindow):
 
     def _launch_screenshot_task(self, index):
         """Launch a screenshot service stress test task."""
-        class ScreenshotStressWorker(Worker):
-            def execute(self):
-                results = {"captures": 0, "errors": 0, "total_time": 0}
-
-                # Run until cancelled or the stress test completes
-                while not self.cancel_requested:
-                    try:
-                        # Time the capture
-                        start_time = time.time()
-
-                        # Capture screenshot
-                        capture_result = self.screenshot_service.capture_region(self.region)
-
-                        # Calculate time
-                        capture_time = time.time() - start_time
-                        results["total_time"] += capture_time
-
-                        if capture_result.is_failure:
-                            results["errors"] += 1
-                            self.report_error(f"Capture error: {capture_result.error}")
-                        else:
-                            results["captures"] += 1
-
-                            # Report occasional progress
-                            if results["captures"] % 10 == 0:
-                                self.report_progress(
-                                    50,
-                                    f"Completed {results['captures']} captures, avg time: {results['total_time']/results['captures']:.3f}s"
-                                )
-
-                        # Small delay to prevent too rapid operations
-                        time.sleep(0.1)
-
-                    except Exception as e:
-                        self.report_error(f"Exception in screenshot stress task: {e}")
-
-                # Calculate average time
-                avg_time = results["total_time"] / results["captures"] if results["captures"] > 0 else 0
-                results["avg_time"] = avg_time
-
-                return results
-
-        worker = ScreenshotStressWorker()
-        worker.screenshot_service = self.screenshot_service
-        worker.region = self.stress_region
+        worker = ScreenshotStressWorker(self.screenshot_service, self.stress_region)
 
         # Set callbacks
         worker.set_on_completed(self.on_stress_task_completed)
@@ -2051,7 +2405,7 @@ class ThreadingTestApp(QMainWindow):
         self.stress_stats_text.append("OCR Service stress test: Concurrent OCR operations...")
 
         # Select entire screen as region if none selected
-        if not hasattr(self, 'ocr_region') or not self.ocr_region:
+        if not self.ocr_region:
             # Use entire screen
             screen = QApplication.primaryScreen()
             rect = screen.geometry()
@@ -2065,62 +2419,7 @@ class ThreadingTestApp(QMainWindow):
 
     def _launch_ocr_task(self, index):
         """Launch an OCR service stress test task."""
-        class OcrStressWorker(Worker):
-            def execute(self):
-                results = {"ocr_operations": 0, "errors": 0, "total_time": 0}
-
-                # Run until cancelled or the stress test completes
-                while not self.cancel_requested:
-                    try:
-                        # Capture screenshot
-                        capture_result = self.screenshot_service.capture_region(self.region)
-
-                        if capture_result.is_failure:
-                            results["errors"] += 1
-                            self.report_error(f"Capture error: {capture_result.error}")
-                            continue
-
-                        image = capture_result.value
-
-                        # Time the OCR operation
-                        start_time = time.time()
-
-                        # Perform OCR
-                        ocr_result = self.ocr_service.extract_text(image)
-
-                        # Calculate time
-                        ocr_time = time.time() - start_time
-                        results["total_time"] += ocr_time
-
-                        if ocr_result.is_failure:
-                            results["errors"] += 1
-                            self.report_error(f"OCR error: {ocr_result.error}")
-                        else:
-                            results["ocr_operations"] += 1
-
-                            # Report occasional progress
-                            if results["ocr_operations"] % 5 == 0:
-                                self.report_progress(
-                                    50,
-                                    f"Completed {results['ocr_operations']} OCR ops, avg time: {results['total_time']/results['ocr_operations']:.3f}s"
-                                )
-
-                        # Larger delay for OCR to prevent overwhelming the CPU
-                        time.sleep(0.5)
-
-                    except Exception as e:
-                        self.report_error(f"Exception in OCR stress task: {e}")
-
-                # Calculate average time
-                avg_time = results["total_time"] / results["ocr_operations"] if results["ocr_operations"] > 0 else 0
-                results["avg_time"] = avg_time
-
-                return results
-
-        worker = OcrStressWorker()
-        worker.screenshot_service = self.screenshot_service
-        worker.ocr_service = self.ocr_service
-        worker.region = self.stress_ocr_region
+        worker = OcrStressWorker(self.screenshot_service, self.ocr_service, self.stress_ocr_region)
 
         # Set callbacks
         worker.set_on_completed(self.on_stress_task_completed)
@@ -2187,15 +2486,14 @@ def main():
         window.show()
         return app.exec()
     except Exception as e:
-        print(f"Fatal error: {e}")
-        import traceback
-        traceback.print_exc()
+        tb = traceback.format_exc()
+        print(f"Fatal error: {e}\n{tb}", file=sys.stderr)
 
         # Try to show error in dialog
         try:
             from PySide6.QtWidgets import QMessageBox
             QMessageBox.critical(None, "Fatal Error",
-                                 f"An unrecoverable error occurred:\n\n{e}\n\n{traceback.format_exc()}")
+                                 f"An unrecoverable error occurred:\n\n{e}\n\n{tb}")
         except:
             pass
 
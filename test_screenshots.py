@@ -11,11 +11,9 @@ This script tests:
 import os
 import sys
 import logging
+from typing import Dict, Any, Optional, Tuple
 from PIL import Image
 
-# Add the project root to the Python path so we can import modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QLabel, QPushButton, QWidget, QTextEdit, \
     QMessageBox
 from PySide6.QtGui import QPixmap
@@ -23,6 +21,10 @@ from PySide6.QtCore import Qt
 
 # Import required services
 from src.domain.services.i_logger_service import ILoggerService
+from src.domain.services.i_background_task_service import Worker
+from src.domain.services.i_ocr_service import IOcrService
+from src.domain.services.i_screenshot_service import IScreenshotService
+from src.domain.common.result import Result
 from src.infrastructure.logging.logger_service import ConsoleLoggerService
 from src.infrastructure.platform.screenshot_service import QtScreenshotService
 from src.infrastructure.ocr.tesseract_ocr_service import TesseractOcrService
@@ -31,6 +33,67 @@ from src.infrastructure.threading.qt_background_task_service import QtBackground
 from src.presentation.components.qt_region_selector import select_region_qt
 
 
+class TextExtractionWorker(Worker[Dict[str, Any]]):
+    """Worker that runs OCR and numeric extraction on a captured screenshot."""
+
+    def __init__(self, ocr_service: IOcrService, image: Image.Image):
+        """Initialize the text extraction worker."""
+        super().__init__()
+        self.ocr_service = ocr_service
+        self.image = image
+
+    def execute(self) -> Result[Dict[str, Any]]:
+        """Extract the text, then any numeric values in it."""
+        text_result = self.ocr_service.extract_text(self.image)
+        if text_result.is_failure:
+            return text_result
+
+        text = text_result.value
+        numbers_result = self.ocr_service.extract_numeric_values(text)
+        return Result.ok({
+            "text": text,
+            "numbers": numbers_result.value if numbers_result.is_success else None,
+            "numbers_error": None if numbers_result.is_success else str(numbers_result.error)
+        })
+
+
+class RegionCaptureWorker(Worker[Dict[str, Any]]):
+    """
+    Worker that captures a region and encodes a display-sized preview of it.
+
+    Only the preview bytes cross the thread boundary; Result serialization would
+    flatten a PIL image, so the full capture stays on the worker as self.image.
+    """
+
+    def __init__(self, screenshot_service: IScreenshotService,
+                 region: Tuple[int, int, int, int], preview_size: Tuple[int, int]):
+        """Initialize the region capture worker."""
+        super().__init__()
+        self.screenshot_service = screenshot_service
+        self.region = region
+        self.preview_size = preview_size
+        self.image: Optional[Image.Image] = None
+
+    def execute(self) -> Dict[str, Any]:
+        """Capture the region, then encode a preview for the UI thread to load."""
+        capture_result = self.screenshot_service.capture_region(self.region)
+        if capture_result.is_failure:
+            return {"success": False, "error": str(capture_result.error)}
+
+        # Downscale here so the UI thread only decodes a small preview
+        image = capture_result.value
+        preview = image.copy()
+        preview.thumbnail(self.preview_size)
+
+        # QPixmap must be created on the UI thread, so hand it encoded bytes
+        bytes_result = self.screenshot_service.to_bytes(preview)
+        if bytes_result.is_failure:
+            return {"success": False, "error": str(bytes_result.error)}
+
+        self.image = image
+        return {"success": True, "value": {"preview_bytes": bytes_result.value, "size": image.size}}
+
+
 class ScreenshotTestWindow(QMainWindow):
     """Test window for screenshot functionality."""
 
@@ -48,6 +111,7 @@ class ScreenshotTestWindow(QMainWindow):
         # Selected region
         self.selected_region = None
         self.captured_screenshot = None
+        self._capture_worker = None
 
     def setup_services(self):
         """Initialize the required services."""
@@ -131,31 +195,59 @@ class ScreenshotTestWindow(QMainWindow):
             # Automatically capture screenshot immediately after selection
             self.log_message("Automatically capturing screenshot of selected region...")
 
-            # Capture the screenshot
-            result = self.screenshot_service.capture_region(self.selected_region)
+            # Capture and encode off the UI thread; only the pixmap is built here
+            preview_size = (max(1, self.screenshot_label.width()), max(1, self.screenshot_label.height()))
+            worker = RegionCaptureWorker(self.screenshot_service, self.selected_region, preview_size)
+            worker.set_on_completed(self.on_region_captured)
+            worker.set_on_error(self.on_region_capture_error)
 
+            result = self.thread_service.execute_task_with_auto_cleanup("capture_region", worker)
             if result.is_success:
-                self.captured_screenshot = result.value
-                self.log_message("Screenshot captured successfully")
-
-                # Convert to QPixmap and display
-                pixmap_result = self.screenshot_service.to_pyside_pixmap(self.captured_screenshot)
-                if pixmap_result.is_success:
-                    pixmap = pixmap_result.value
-                    self.screenshot_label.setPixmap(pixmap.scaled(
-                        self.screenshot_label.width(),
-                        self.screenshot_label.height(),
-                        Qt.KeepAspectRatio
-                    ))
-                    self.ocr_btn.setEnabled(True)
-                    self.save_btn.setEnabled(True)
-                else:
-                    self.log_message(f"Error converting to pixmap: {pixmap_result.error}")
+                self._capture_worker = worker
+                self.select_region_btn.setEnabled(False)
             else:
-                self.log_message(f"Error capturing screenshot: {result.error}")
+                self.log_message(f"Error starting capture: {result.error}")
         else:
             self.log_message("Region selection cancelled")
 
+    def on_region_captured(self, result):
+        """
+        Show the screenshot captured by RegionCaptureWorker.
+
+        The worker's {"success", "value"/"error"} dict arrives rebuilt as a Result by
+        execute_task_with_auto_cleanup; the value is passed through as-is, so the
+        preview bytes are intact.
+        """
+        self.select_region_btn.setEnabled(True)
+        worker, self._capture_worker = self._capture_worker, None
+
+        if result.is_failure:
+            self.log_message(f"Error capturing screenshot: {result.error}")
+            return
+
+        self.captured_screenshot = worker.image
+        width, height = result.value["size"]
+        self.log_message(f"Screenshot captured successfully ({width}x{height})")
+
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(result.value["preview_bytes"]):
+            self.log_message("Error converting to pixmap: could not decode preview")
+            return
+
+        self.screenshot_label.setPixmap(pixmap.scaled(
+            self.screenshot_label.width(),
+            self.screenshot_label.height(),
+            Qt.KeepAspectRatio
+        ))
+        self.ocr_btn.setEnabled(True)
+        self.save_btn.setEnabled(True)
+
+    def on_region_capture_error(self, error):
+        """Handle an unexpected failure in RegionCaptureWorker."""
+        self.select_region_btn.setEnabled(True)
+        self._capture_worker = None
+        self.log_message(f"Error capturing screenshot: {error}")
+
     def on_extract_text(self):
         """Extract text from the captured screenshot."""
         if not self.captured_screenshot:
@@ -164,27 +256,41 @@ class ScreenshotTestWindow(QMainWindow):
 
         self.log_message("Extracting text...")
 
-        # Extract text using OCR
-        result = self.ocr_service.extract_text(self.captured_screenshot)
+        # Tesseract takes hundreds of milliseconds; run it off the UI thread
+        worker = TextExtractionWorker(self.ocr_service, self.captured_screenshot)
+        worker.set_on_completed(self.on_text_extracted)
+        worker.set_on_error(self.on_text_extraction_error)
 
+        result = self.thread_service.execute_task_with_auto_cleanup("extract_text", worker)
         if result.is_success:
-            text = result.value
+            self.ocr_btn.setEnabled(False)
+        else:
+            self.log_message(f"Error starting text extraction: {result.error}")
+
+    def on_text_extracted(self, result):
+        """Show the text and numeric values extracted by TextExtractionWorker."""
+        self.ocr_btn.setEnabled(True)
+
+        if result.is_success:
+            values = result.value
             self.log_message("Text extracted successfully")
-            self.text_output.setText(text)
-
-            # Extract numeric values
-            numbers_result = self.ocr_service.extract_numeric_values(text)
-            if numbers_result.is_success:
-                numbers = numbers_result.value
-                if numbers:
-                    self.log_message(f"Numeric values found: {numbers}")
-                else:
-                    self.log_message("No numeric values found in the text")
+            self.text_output.setText(values["text"])
+
+            # Report numeric values
+            if values["numbers_error"] is not None:
+                self.log_message(f"Error extracting numeric values: {values['numbers_error']}")
+            elif values["numbers"]:
+                self.log_message(f"Numeric values found: {values['numbers']}")
             else:
-                self.log_message(f"Error extracting numeric values: {numbers_result.error}")
+                self.log_message("No numeric values found in the text")
         else:
             self.log_message(f"Error extracting text: {result.error}")
 
+    def on_text_extraction_error(self, error):
+        """Handle an unexpected failure in TextExtractionWorker."""
+        self.ocr_btn.setEnabled(True)
+        self.log_message(f"Error extracting text: {error}")
+
     def on_save_screenshot(self):
         """Save the screenshot to a file."""
         if not self.captured_screenshot:
@@ -237,6 +343,11 @@ class ScreenshotTestWindow(QMainWindow):
         # Display status
         QMessageBox.information(self, "Service Status", "\n".join(status_messages))
 
+    def closeEvent(self, event):
+        """Cancel background work before the window closes."""
+        self.thread_service.cancel_all_tasks()
+        event.accept()
+
     def log_message(self, message):
         """Log a message to both the UI and the logger."""
         self.logger.info(message)
@@ -8,6 +8,7 @@ This script can be run directly to test the block verification sequence.
 import sys
 import os
 import logging
+from typing import Any, Dict
 from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QLabel, \
     QLineEdit, QFileDialog, QMessageBox, QComboBox, QGroupBox
 from PySide6.QtCore import Qt, QTimer
@@ -20,8 +21,9 @@ if project_root not in sys.path:
 
 # Import necessary services
 from src.domain.common.di_container import DIContainer
+from src.domain.common.result import Result
 from src.domain.services.i_logger_service import ILoggerService
-from src.domain.services.i_background_task_service import IBackgroundTaskService
+from src.domain.services.i_background_task_service import IBackgroundTaskService, Worker
 from src.domain.services.i_config_repository_service import IConfigRepository
 from src.domain.services.i_verification_service import IVerificationService
 from src.infrastructure.logging.logger_service import ConsoleLoggerService, FileLoggerService
@@ -30,11 +32,35 @@ from src.infrastructure.config.json_config_repository import JsonConfigRepositor
 from src.infrastructure.platform.verification_service import WindowsVerificationService
 
 
+class ConfigLoadWorker(Worker[Dict[str, Any]]):
+    """Worker that reads the settings the window needs in one config load."""
+
+    def __init__(self, config_repo: IConfigRepository):
+        """Initialize the config load worker."""
+        super().__init__()
+        self.config_repo = config_repo
+
+    def execute(self) -> Result[Dict[str, Any]]:
+        """Execute the worker task."""
+        return Result.ok(self.config_repo.get_snapshot())
+
+
 class BlockVerificationTestWindow(QMainWindow):
     """
     Test window for the block verification functionality.
     """
 
+    # Full status label style sheet per status level
+    STATUS_STYLES = {
+        level: f"font-weight: bold; padding: 10px; border-radius: 5px; {colors}"
+        for level, colors in {
+            "error": "color: #D32F2F; background-color: #FFEBEE;",
+            "warning": "color: #FF8F00; background-color: #FFF8E1;",
+            "success": "color: #388E3C; background-color: #E8F5E9;",
+            "info": "color: #1976D2; background-color: #E3F2FD;",
+        }.items()
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Block Verification Test")
@@ -184,9 +210,29 @@ class BlockVerificationTestWindow(QMainWindow):
         main_layout.addWidget(help_group)
 
     def load_config_values(self):
-        """Load values from configuration."""
+        """Load values from configuration without blocking the first paint."""
+        self.path_field.setPlaceholderText("Loading...")
+
+        # Read the config on a background thread; widgets are filled in on completion
+        worker = ConfigLoadWorker(self.config_repo)
+        worker.set_on_completed(self.apply_config_values)
+        worker.set_on_error(lambda error: self.update_status(f"Failed to load configuration: {error}", "error"))
+
+        result = self.thread_service.execute_task_with_auto_cleanup("load_config_values", worker)
+        if result.is_failure:
+            self.update_status(f"Failed to load configuration: {result.error}", "error")
+
+    def apply_config_values(self, result):
+        """Apply configuration values loaded by load_config_values."""
+        self.path_field.setPlaceholderText("")
+        if result.is_failure:
+            self.update_status(f"Failed to load configuration: {result.error}", "error")
+            return
+
+        values = result.value
+
         # Load Cold Turkey path
-        ct_path = self.config_repo.get_cold_turkey_path()
+        ct_path = values["cold_turkey_path"]
         if ct_path:
             self.path_field.setText(ct_path)
             self.update_status(f"Cold Turkey Blocker found at: {ct_path}", "info")
@@ -194,20 +240,20 @@ class BlockVerificationTestWindow(QMainWindow):
             self.update_status("Cold Turkey Blocker path not configured", "warning")
 
         # Load platform
-        current_platform = self.config_repo.get_current_platform()
+        current_platform = values["current_platform"]
         if current_platform:
             index = self.platform_combo.findText(current_platform)
             if index >= 0:
                 self.platform_combo.setCurrentIndex(index)
 
         # Load block name from verified blocks
-        verified_blocks = self.verification_service.get_verified_blocks()
-        if verified_blocks.is_success and verified_blocks.value:
-            self.refresh_verified_blocks_display(verified_blocks.value)
+        verified_blocks = values["verified_blocks"]
+        if verified_blocks:
+            self.refresh_verified_blocks_display(verified_blocks)
 
             # Find block for current platform
             current_platform = self.platform_combo.currentText()
-            for block in verified_blocks.value:
+            for block in verified_blocks:
                 if block.get("platform") == current_platform:
                     self.block_name_field.setText(block.get("block_name", ""))
                     break
@@ -355,21 +401,15 @@ class BlockVerificationTestWindow(QMainWindow):
         """Update the status label with a message."""
         # Log the message
         if level == "error":
-            style = "color: #D32F2F; background-color: #FFEBEE;"
             self.logger.error(message)
         elif level == "warning":
-            style = "color: #FF8F00; background-color: #FFF8E1;"
             self.logger.warning(message)
-        elif level == "success":
-            style = "color: #388E3C; background-color: #E8F5E9;"
-            self.logger.info(message)
-        elif level == "info":
-            style = "color: #1976D2; background-color: #E3F2FD;"
+        else:
             self.logger.info(message)
 
         # Update the status label
         self.status_label.setText(f"Status: {message}")
-        self.status_label.setStyleSheet(f"font-weight: bold; padding: 10px; border-radius: 5px; {style}")
+        self.status_label.setStyleSheet(self.STATUS_STYLES.get(level, self.STATUS_STYLES["info"]))
 
     def refresh_verified_blocks_display(self, blocks):
         """Update the verified blocks display."""
@@ -377,14 +417,11 @@ class BlockVerificationTestWindow(QMainWindow):
             self.verified_blocks_label.setText("No verified blocks")
             return
 
-        html = "<ul>"
-        for block in blocks:
-            platform = block.get("platform", "Unknown")
-            block_name = block.get("block_name", "Unknown")
-            html += f"<li><b>{platform}:</b> {block_name}</li>"
-        html += "</ul>"
-
-        self.verified_blocks_label.setText(html)
+        items = "".join(
+            f"<li><b>{block.get('platform', 'Unknown')}:</b> {block.get('block_name', 'Unknown')}</li>"
+            for block in blocks
+        )
+        self.verified_blocks_label.setText(f"<ul>{items}</ul>")
 
     def closeEvent(self, event):
         """Handle application close event."""